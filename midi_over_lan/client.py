@@ -116,7 +116,7 @@ def main_loop(interface_ip: str = '',
                     time.sleep(0.001)
                 with DelayedKeyboardInterrupt():  # prevents KeyboardInterrupt from being raised while receiving data
                     try:
-                        data, addr = sock.recvfrom(1024)  # buffer size of 1024 bytes
+                        data, addr = sock.recvfrom(4096)  # buffer size of 4096 bytes (MIDI message packets may hold several messages)
                     except BlockingIOError:
                         continue  # no data received
                     try:
@@ -126,13 +126,13 @@ def main_loop(interface_ip: str = '',
                         continue
                     printv(2, f"Received packet from {addr} of type {type(packet)}")
                     if isinstance(packet, MidiMessagePacket):  # got some MIDI data
-                        midi_msg = mido.parse(packet.midi_data)
-                        if ignore_clock and midi_msg.type == 'clock':
-                            continue
-                        if not suppress_console_output:
-                            print(f"From {addr}: {packet.device_name}: {midi_msg}")
-                        if port:
-                            port.send(midi_msg)
+                        for midi_msg in mido.parse_all(packet.midi_data):  # a packet may contain several MIDI messages
+                            if ignore_clock and midi_msg.type == 'clock':
+                                continue
+                            if not suppress_console_output:
+                                print(f"From {addr}: {packet.device_name}: {midi_msg}")
+                            if port:
+                                port.send(midi_msg)
                     if isinstance(packet, (HelloPacket, HelloReplyPacket)):
                         printv(3, packet)
         except KeyboardInterrupt:
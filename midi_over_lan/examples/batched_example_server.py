@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2025 Christoph Hänisch.
+# This file is part of the MIDI over LAN project.
+# It is licensed under the GNU Lesser General Public License v3.0.
+# See the LICENSE file for more details.
+
+"""Example of a MIDI over LAN server that sends the packets in batches.
+
+Every three seconds, a note on and a note off message are sent. MIDI messages
+that are ready at the same time are packed into as few packets as possible
+(each packet stays below the path MTU); receivers must decode such packets
+with mido.parse_all(). Several packets are sent with a single system call
+(sendmmsg) on Linux; on other platforms, they are sent one by one. See
+minimal_example_server.py for a server without these optimizations.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import platform
+import socket
+import time
+import mido
+from midi_over_lan.protocol import MidiMessagePacket, MAXIMUM_MIDI_MESSAGE_PACKET_SIZE, MULTICAST_GROUP_ADDRESS, MULTICAST_PORT_NUMBER
+
+INTERFACE_IP = '192.168.0.50' # Change this to the IP address of the network interface to be used.
+DEVICE_NAME = 'example script'
+MAXIMUM_BATCH_SIZE = 64  # maximum number of packets sent with a single system call
+ENABLE_MULTICAST_LOOP = True  # must be True if a client on this machine shall receive the packets
+
+
+class IoVec(ctypes.Structure):  # struct iovec
+    _fields_ = [('iov_base', ctypes.c_void_p),
+                ('iov_len', ctypes.c_size_t)]
+
+
+class MsgHdr(ctypes.Structure):  # struct msghdr
+    _fields_ = [('msg_name', ctypes.c_void_p),
+                ('msg_namelen', ctypes.c_uint32),
+                ('msg_iov', ctypes.POINTER(IoVec)),
+                ('msg_iovlen', ctypes.c_size_t),
+                ('msg_control', ctypes.c_void_p),
+                ('msg_controllen', ctypes.c_size_t),
+                ('msg_flags', ctypes.c_int)]
+
+
+class MMsgHdr(ctypes.Structure):  # struct mmsghdr
+    _fields_ = [('msg_hdr', MsgHdr),
+                ('msg_len', ctypes.c_uint)]
+
+
+def load_sendmmsg():
+    """Return the sendmmsg() function of the C library or None if it is not available."""
+    if platform.system() != 'Linux':
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        sendmmsg = libc.sendmmsg
+    except (OSError, AttributeError):
+        return None
+    sendmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(MMsgHdr), ctypes.c_uint, ctypes.c_int]
+    sendmmsg.restype = ctypes.c_int
+    return sendmmsg
+
+
+_sendmmsg = load_sendmmsg()
+
+# The message headers and I/O vectors are set up once; only the payloads are
+# replaced for each batch. The socket is connected, so no address is needed.
+_iovecs = (IoVec * MAXIMUM_BATCH_SIZE)()
+_messages = (MMsgHdr * MAXIMUM_BATCH_SIZE)()
+for _i in range(MAXIMUM_BATCH_SIZE):
+    _messages[_i].msg_hdr.msg_iov = ctypes.pointer(_iovecs[_i])
+    _messages[_i].msg_hdr.msg_iovlen = 1
+
+
+def pack_midi_messages(prefix: bytes, messages: list[mido.Message]) -> list[bytes]:
+    """Pack the MIDI messages into as few packets as possible.
+
+    Consecutive MIDI messages are appended to the same packet as long as the
+    packet does not exceed MAXIMUM_MIDI_MESSAGE_PACKET_SIZE bytes. The prefix
+    (header and device name) is prepended to each packet.
+    """
+    maximum_payload_size = MAXIMUM_MIDI_MESSAGE_PACKET_SIZE - len(prefix)
+    packets = []
+    payload = bytearray()
+    for message in messages:
+        data = message.bin()
+        if payload and len(payload) + len(data) > maximum_payload_size:
+            packets.append(prefix + payload)
+            payload = bytearray()
+        payload += data
+    if payload:
+        packets.append(prefix + payload)
+    return packets
+
+
+def send_batch(sock: socket.socket, packets: list[bytes]):
+    """Send the packets to the address the socket is connected to.
+
+    On Linux, up to MAXIMUM_BATCH_SIZE packets are sent with a single call of
+    sendmmsg(); otherwise, each packet is sent separately. If sendmmsg() does
+    not send any packet, the remaining packets are sent separately as well.
+    """
+    if _sendmmsg is None:
+        for packet in packets:
+            sock.send(packet)
+        return
+
+    while packets:
+        batch = packets[:MAXIMUM_BATCH_SIZE]
+        buffers = [ctypes.c_char_p(packet) for packet in batch]  # keep the buffers alive during the call
+        for i, packet in enumerate(batch):
+            _iovecs[i].iov_base = ctypes.cast(buffers[i], ctypes.c_void_p)
+            _iovecs[i].iov_len = len(packet)
+        number_of_sent_packets = _sendmmsg(sock.fileno(), _messages, len(batch), 0)
+        if number_of_sent_packets < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        if number_of_sent_packets == 0:  # avoid spinning; sock.send() raises an error if sending fails
+            for packet in packets:
+                sock.send(packet)
+            return
+        packets = packets[number_of_sent_packets:]
+
+
+def configure_multicast_sender(sock: socket.socket, interface_ip: str, ttl: int = 1,
+                               send_buffer_size: int = 1 << 20, loop: bool = True):
+    """Configure a UDP socket for sending multicast packets.
+
+    The packets are sent via the network interface with the given IP address.
+    With a TTL of 1, the packets do not leave the local network. The loopback
+    must stay enabled (the default) if a client on this machine shall receive
+    the packets; disabling it saves the kernel from copying each packet.
+
+    The send buffer is enlarged so that bursts of packets do not block the
+    sender. Note, the operating system may limit the buffer size (on Linux,
+    see the sysctl setting net.core.wmem_max); a warning is printed if the
+    requested size was not granted.
+    """
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(interface_ip))
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, ttl)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1 if loop else 0)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, send_buffer_size)
+    granted_size = sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+    if granted_size < send_buffer_size:  # Linux reports twice the requested size
+        print(f"Warning: The send buffer size is {granted_size} bytes instead of {send_buffer_size} bytes.")
+
+
+with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP) as sock:
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    configure_multicast_sender(sock, INTERFACE_IP, loop=ENABLE_MULTICAST_LOOP)
+    sock.connect((MULTICAST_GROUP_ADDRESS, MULTICAST_PORT_NUMBER))
+    # Only the MIDI data differs between the packets; the header and the device
+    # name field (i.e., the packet prefix) are serialized once.
+    prefix = MidiMessagePacket(device_name=DEVICE_NAME).prefix_to_bytes()
+    messages = [mido.Message('note_on', note=60, velocity=64),
+                mido.Message('note_off', note=60, velocity=64)]
+    while True:
+        packets = pack_midi_messages(prefix, messages)
+        send_batch(sock, packets)
+        time.sleep(3)
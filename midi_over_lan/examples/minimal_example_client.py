@@ -23,7 +23,7 @@ with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP) as soc
 
     while True:
         try:
-            data, addr = sock.recvfrom(1024)  # buffer size of 1024 bytes
+            data, addr = sock.recvfrom(4096)  # buffer size of 4096 bytes
         except BlockingIOError:
             continue  # no data received
         try:
@@ -34,5 +34,5 @@ with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP) as soc
             print(f"Received invalid packet from {addr}")
             continue
         if isinstance(packet, MidiMessagePacket):  # got some MIDI data
-            midi_msg = mido.parse(packet.midi_data)
-            print(midi_msg)
+            for midi_msg in mido.parse_all(packet.midi_data):  # a packet may contain several MIDI messages
+                print(midi_msg)
@@ -17,10 +17,9 @@ INTERFACE_IP = '192.168.0.50' # Change this to the IP address of the network int
 with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP) as sock:
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(INTERFACE_IP))
+    # The header and the device name (i.e., the packet prefix) are serialized once.
+    prefix = MidiMessagePacket(device_name='example script').prefix_to_bytes()
     message = mido.Message('note_on', note=60, velocity=64)
     while True:
-        packet = MidiMessagePacket()
-        packet.device_name='example script'
-        packet.midi_data=bytes(message.bytes())
-        sock.sendto(packet.to_bytes(), (MULTICAST_GROUP_ADDRESS, MULTICAST_PORT_NUMBER))
+        sock.sendto(prefix + message.bin(), (MULTICAST_GROUP_ADDRESS, MULTICAST_PORT_NUMBER))
         time.sleep(3)
@@ -0,0 +1,56 @@
+# Copyright (c) 2025 Christoph Hänisch.
+# This file is part of the MIDI over LAN project.
+# It is licensed under the GNU Lesser General Public License v3.0.
+# See the LICENSE file for more details.
+
+"""This module implements a helper for running blocking functions in the background.
+
+Blocking calls (e.g., opening MIDI ports or reverse DNS lookups) must not run in
+the GUI thread, since they would freeze the user interface. run_in_background()
+calls such a function in a thread of the global thread pool and passes the
+result to a slot that is executed in the GUI thread.
+"""
+
+# pylint: disable=no-name-in-module
+
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class BackgroundTaskSignals(QObject):
+    """Signals of the BackgroundTask class."""
+    finished = Signal(object)  # result of the function
+
+
+class BackgroundTask(QRunnable):
+    """Call a function in a thread of the thread pool and emit its result.
+
+    A QRunnable is not a QObject and thus cannot emit signals itself. Instead,
+    the `signals.finished` signal of a separate QObject is emitted. This object
+    is created in the thread that creates the task (e.g., the GUI thread); thus,
+    the signal is delivered to the connected slots via a queued connection, and
+    the slots may safely update the GUI.
+    """
+
+    def __init__(self, function: Callable[..., Any], *args: Any):
+        """Initialize the task with the function and its arguments."""
+        super().__init__()
+        self.function = function
+        self.args = args
+        self.signals = BackgroundTaskSignals()
+
+    def run(self):
+        """Call the function and emit the result."""
+        self.signals.finished.emit(self.function(*self.args))
+
+
+def run_in_background(function: Callable[..., Any], *args: Any, on_finished: Callable[[Any], None]):
+    """Call function(*args) in a thread of the global thread pool.
+
+    When the function returns, its result is passed to on_finished, which is
+    called in the thread that called run_in_background() (e.g., the GUI thread).
+    """
+    task = BackgroundTask(function, *args)
+    task.signals.finished.connect(on_finished)
+    QThreadPool.globalInstance().start(task)  # the thread pool takes ownership of the task
@@ -21,25 +21,73 @@
 # pylint: disable=invalid-name
 
 import logging
-from PySide6.QtCore import QObject, Signal, Slot
+import threading
+import time
+from collections import deque
+from PySide6.QtCore import Qt, QTimer, Signal, Slot
+from PySide6.QtGui import QColor, QTextCharFormat, QTextCursor
 from PySide6.QtWidgets import QDialog, QWidget
 from ui_debug_messages_dialog import Ui_DebugMessages
 
 
 logger=logging.getLogger('midi_over_lan')  # pylint: disable=invalid-name
 
+# Text colors of the log entries. The list is indexed by min(levelno // 10, 5),
+# i.e., NOTSET, DEBUG, INFO, WARNING, ERROR, and CRITICAL (or higher).
+TEXT_COLORS = ("black", "blue", "green", "orange", "red", "purple")
+
 
 class DebugMessagesDialog(QDialog, Ui_DebugMessages):
     """Debug message window for the GUI."""
 
+    messagesPending = Signal()  # emitted when a log message is added to the empty buffer
+
     def __init__(self, parent: QWidget = None):
         """Initialize the debug message window."""
         super().__init__(parent=parent)
         self.setupUi(self)
         self.radioButton_Info.setChecked(True)  # Set the default log level to INFO
         self.displayed_log_level = logging.INFO
+        self.logging_handler: logging.Handler | None = None  # set by the LoggingHandler passing records to the dialog
         self.scroll_to_bottom = True
-        self.textEdit_DebugMessages.append("Debug messages:\n")
+
+        # Limit the number of lines (i.e., text blocks) of the text edit widget.
+        # If the limit is reached, the oldest lines are removed; thus, adding a
+        # line takes constant time regardless of the session length.
+        self.textEdit_DebugMessages.setUndoRedoEnabled(False)
+        self.textEdit_DebugMessages.document().setMaximumBlockCount(self.spinBox_MaximumNumberOfLines.value())
+        self.formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(module)s - line %(lineno)d - %(message)s')
+        self.text_formats: list[QTextCharFormat] = []  # character formats of the log entries (same indices as TEXT_COLORS)
+        for text_color in TEXT_COLORS:
+            text_format = QTextCharFormat()
+            text_format.setForeground(QColor(text_color))
+            self.text_formats.append(text_format)
+
+        # Log messages may arrive from any thread at a high rate. They are
+        # collected in a bounded buffer and added to the text edit widget in
+        # batches by a timer (i.e., from the GUI thread), which keeps the number
+        # of layout passes and scroll bar updates low. The timer is only started
+        # when the first message is added to the empty buffer, i.e., there is at
+        # most one (queued) signal per batch and the timer does not run while
+        # no messages arrive.
+        self.pending_messages: deque[tuple[QTextCharFormat, str]] = deque(maxlen=10000)  # tuples (character format, log entry)
+        self.pending_messages_lock = threading.Lock()
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setInterval(50)  # 50 ms
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.timeout.connect(self.flush_messages)
+        self.messagesPending.connect(self.flush_timer.start)
+
+        # Log records dropped by the rate limit filter (which is attached to the
+        # LoggingHandler) are summarized once per second. Records are only
+        # dropped right after many records of the same group were displayed;
+        # thus, the timer is started by flush_messages() and is not restarted
+        # once no more records are dropped.
+        self.rate_limit_filter = RateLimitFilter()
+        self.suppressed_messages_timer = QTimer(self)
+        self.suppressed_messages_timer.setInterval(1000)  # 1000 ms
+        self.suppressed_messages_timer.setSingleShot(True)
+        self.suppressed_messages_timer.timeout.connect(self.report_suppressed_messages)
 
         # Connect the GUI elements to the functions.
         self.radioButton_Debug.clicked.connect(lambda: self.set_loglevel(logging.DEBUG))
@@ -48,40 +96,82 @@ class DebugMessagesDialog(QDialog, Ui_DebugMessages):
         self.radioButton_Error.clicked.connect(lambda: self.set_loglevel(logging.ERROR))
         self.radioButton_Critical.clicked.connect(lambda: self.set_loglevel(logging.CRITICAL))
         self.checkBox_ScrollToBottom.stateChanged.connect(self.set_scroll_to_bottom)
+        self.spinBox_MaximumNumberOfLines.valueChanged.connect(self.set_maximum_number_of_lines)
 
 
-    @Slot(str)
     def add_message(self, record: logging.LogRecord):
-        """Add a log message to the debug message window."""
+        """Add a log message to the debug message window.
+
+        The message is buffered and displayed with the next call of
+        flush_messages(). The method may be called from any thread.
+        """
 
         # Check if the log level is below the displayed log level.
         if record.levelno < self.displayed_log_level:
             return
 
-        # Format the log message and add it to the text edit widget.
-        if record.levelno < 10:  # NOTSET
-            text_color = "black"
-        elif record.levelno < 20:  # DEBUG
-            text_color = "blue"
-        elif record.levelno < 30:  # INFO
-            text_color = "green"
-        elif record.levelno < 40:  # WARNING
-            text_color = "orange"
-        elif record.levelno < 50:  # ERROR
-            text_color = "red"
-        else:  # CRITICAL
-            text_color = "purple"
-        log_entry = f'<font color="{text_color}">{record.asctime} - {record.levelname} - {record.module} - line {record.lineno} - {record.message}</font>'
-
-        # Add the log entry to the text edit widget.
-        self.textEdit_DebugMessages.append(log_entry)
+        # Format the log message. The formatter sets the record's asctime and
+        # message attributes, so the entry does not depend on other handlers.
+        text_format = self.text_formats[min(record.levelno // 10, 5)]
+        log_entry = self.formatter.format(record)
+
+        # Buffer the log entry; it is added to the text edit widget by flush_messages().
+        with self.pending_messages_lock:
+            was_empty = not self.pending_messages
+            self.pending_messages.append((text_format, log_entry))
+        if was_empty:
+            self.messagesPending.emit()
+
+
+    @Slot()
+    def flush_messages(self):
+        """Add all buffered log messages to the text edit widget at once."""
+        with self.pending_messages_lock:
+            if not self.pending_messages:
+                return
+            batch = list(self.pending_messages)
+            self.pending_messages.clear()
+
+        # Add the log entries to the text edit widget. The entries are inserted
+        # as plain text with cached character formats, which avoids parsing HTML.
+        cursor = QTextCursor(self.textEdit_DebugMessages.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        for text_format, log_entry in batch:
+            if not cursor.atStart():
+                cursor.insertBlock()
+            cursor.insertText(log_entry, text_format)
+        cursor.endEditBlock()
         if self.scroll_to_bottom:
             self.textEdit_DebugMessages.verticalScrollBar().setValue(self.textEdit_DebugMessages.verticalScrollBar().maximum())
 
+        if not self.suppressed_messages_timer.isActive():
+            self.suppressed_messages_timer.start()
+
+
+    @Slot()
+    def report_suppressed_messages(self):
+        """Add a log entry for each group of log records dropped by the rate limit filter."""
+        suppressed_counts = self.rate_limit_filter.pop_suppressed_counts()
+        for (module, lineno, levelno), suppressed_count in suppressed_counts.items():
+            record = logging.makeLogRecord({'name': logger.name,
+                                            'levelno': levelno,
+                                            'levelname': logging.getLevelName(levelno),
+                                            'module': module,
+                                            'lineno': lineno,
+                                            'msg': f'{suppressed_count} similar messages suppressed'})
+            self.add_message(record)
+        if suppressed_counts:
+            self.suppressed_messages_timer.start()  # records of these groups may still be dropped
+
 
     def set_loglevel(self, loglevel: int):
         """Set the log level of the debug message window."""
         self.displayed_log_level = loglevel
+        # Records below the displayed log level are discarded by the handler
+        # itself; thus, they are neither rate limited nor formatted.
+        if self.logging_handler:
+            self.logging_handler.setLevel(loglevel)
         # TODO: The below code does not seem to have any effect. Maybe define worker messages
         # in the logging setup module and set the log level there... 
         logger_names = ('midi_over_lan',
@@ -94,6 +184,11 @@ class DebugMessagesDialog(QDialog, Ui_DebugMessages):
             logger.setLevel(loglevel)
 
 
+    def set_maximum_number_of_lines(self, value: int):
+        """Set the maximum number of lines of the debug message window."""
+        self.textEdit_DebugMessages.document().setMaximumBlockCount(value)
+
+
     def set_scroll_to_bottom(self, state: int):
         """Set the scroll to bottom state of the debug message window."""
         # The state is either of type 'int' and 0 (unchecked) or 2 (checked),
@@ -105,31 +200,72 @@ class DebugMessagesDialog(QDialog, Ui_DebugMessages):
         self.scroll_to_bottom = state
 
 
-class SignalProxy(QObject):
-    """A proxy class that emits LogRecords with Qt's signals and slots mechanism.
-    
-    This class is used to emit signals from the below logging handler to the Qt
-    GUI. It is necessary because a) there is a name clash with the emit method
-    of the logging.Handler class and b) the logging handler runs in a different
-    thread and updating the GUI from a different thread is not allowed in Qt.
+class RateLimitFilter(logging.Filter):
+    """A logging filter that drops log records exceeding a given rate.
+
+    Log records are grouped by their origin (module, line number, and level).
+    For each group, at most `rate` records per second pass the filter (token
+    bucket with a capacity of `rate` records); further records are dropped.
+    Thus, bursts of identical messages (e.g., one message per MIDI packet)
+    cannot flood the debug messages dialog.
+
+    The number of dropped records per group is counted; the counts are
+    collected periodically by the debug messages dialog (see
+    pop_suppressed_counts()), so they are reported even if no further record
+    of the group is logged.
     """
-    signal = Signal(logging.LogRecord)
+
+    def __init__(self, rate: float = 200):
+        """Initialize the filter with the given rate (records per second and group)."""
+        super().__init__()
+        self.rate = rate
+        self.buckets: dict[tuple[str, int, int], list] = {}  # key is (module, lineno, levelno); value is [tokens, timestamp, suppressed count]
+        self.lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return False if the record exceeds the rate of its group."""
+        key = (record.module, record.lineno, record.levelno)
+        now = time.monotonic()
+        with self.lock:
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                bucket = self.buckets[key] = [self.rate, now, 0]
+            tokens = min(self.rate, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if tokens < 1:
+                bucket[0] = tokens
+                bucket[2] += 1
+                return False
+            bucket[0] = tokens - 1
+        return True
+
+    def pop_suppressed_counts(self) -> dict[tuple[str, int, int], int]:
+        """Return the number of dropped records per group since the last call and reset the counts."""
+        with self.lock:
+            suppressed_counts = {key: bucket[2] for key, bucket in self.buckets.items() if bucket[2]}
+            for key in suppressed_counts:
+                self.buckets[key][2] = 0
+        return suppressed_counts
 
 
 class LoggingHandler(logging.Handler):
-    """A custom logging handler that emits log messages via Qt signals.
+    """A custom logging handler that passes log records to the debug messages dialog.
     
-    Note, the signal proxy member is used to emit the log messages to the Qt GUI
-    (see SignalProxy for more details). The logRecordReceived signal must be
-    connected to the add_message slot of the DebugMessagesDialog class.
+    The handler may run in a different thread than the GUI. Since updating the
+    GUI from a different thread is not allowed in Qt, the dialog only buffers
+    the log records passed to it and displays them periodically from within the
+    GUI thread (see DebugMessagesDialog.flush_messages()).
+
+    The level of the handler follows the log level displayed by the dialog.
     """
 
     def __init__(self, debug_messages_dialog: DebugMessagesDialog):
         """Initialize the handler with the given Qt widget."""
-        super().__init__()
+        super().__init__(level=debug_messages_dialog.displayed_log_level)
         self.debug_messages_dialog = debug_messages_dialog
-        self.logRecordReceived = SignalProxy()
+        debug_messages_dialog.logging_handler = self
+        self.addFilter(debug_messages_dialog.rate_limit_filter)
 
     def emit(self, record: logging.LogRecord):
-        """Emit a log record to the Qt widget."""
-        self.logRecordReceived.signal.emit(record)
+        """Pass a log record to the debug messages dialog."""
+        self.debug_messages_dialog.add_message(record)
@@ -9,49 +9,75 @@
 # pylint: disable=no-name-in-module
 # pylint: disable=invalid-name
 
+from collections import deque
 from typing import List, Tuple
 
-from PySide6.QtCharts import QChart, QChartView, QSplineSeries
-from PySide6.QtCore import QMargins, QPointF, Qt
+from PySide6.QtCharts import QChart, QChartView, QLineSeries
+from PySide6.QtCore import QMargins, QPointF, QTimer
 from PySide6.QtGui import QColor, QPen, QPainter
-from PySide6.QtWidgets import QWidget, QVBoxLayout
+from PySide6.QtWidgets import QGraphicsScene, QGraphicsView, QWidget, QVBoxLayout
 
 
 class LineChart(QWidget):
     """Display a line chart from a given list of 2D points.
 
     Points are added to the chart using the add_point method, and the chart is
-    updated automatically. Alternatively, all points can be set at once using the
-    set_points method. None values are ignored.
+    updated automatically (shortly after; as long as the new points lie within
+    the current y range, only the new points are added to the chart).
+    Alternatively, all points can be set at once using the set_points method.
+    None values are ignored.
 
     The background color can be set using the set_background_color method (default
     is transparent), the line color can be set using the set_line_color method
     (default is black), and the line width can be set using the set_line_width
     method (default is 1). The chart is always scaled to fit the current view. The
     chart can be cleared using the clear method.
+
+    Only the most recent points are kept (default is 1000 points); the number
+    of points can be set using the set_window_size method.
     """
 
     def __init__(self, parent=None):
         """Initialize the LineChart class."""
         super().__init__(parent)
 
-        self.points: List[Tuple[float, float]] = []
+        self.window_size = 1000  # maximum number of points shown in the chart
+        self.points: deque[Tuple[float, float]] = deque(maxlen=self.window_size)
         self.line_color = QColor(0, 0, 0)  # black
         self.line_width = 1
         self.background_color = QColor("transparent")
-
-        # Create the chart (show only the graph/spline and nothing else)
+        self.min_x = self.max_x = 0.0  # range of the x values shown in the chart
+        self.min_y = self.max_y = 0.0  # range of the y values used for normalizing the points
+        self.pending_points: List[Tuple[float, float]] = []  # points added since the last update of the chart
+        self.evicted_points: List[Tuple[float, float]] = []  # points dropped from the window since the last update of the chart
+
+        # Coalesce the updates of the chart if many points are added at once
+        # (at most one update per frame).
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setInterval(16)  # 16 ms
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.timeout.connect(self.flush_pending_points)
+
+        # Create the chart (show only the graph and nothing else)
         self.chart = QChart()
-        self.series = QSplineSeries()
+        self.series = QLineSeries()
         self.chart.addSeries(self.series)
         self.chart.legend().hide()
         self.chart.createDefaultAxes()
         self.chart.axisX().setVisible(False)
         self.chart.axisY().setVisible(False)
+        self.chart.axisY().setRange(-0.2, 1.2)  # the y values are normalized to [0, 1]
         self.chart.setMargins(QMargins(0, 0, 0, 0))  # remove chart margins
+        self.chart.setBackgroundRoundness(0)
         self.chart_view = QChartView(self.chart)
         self.chart_view.setStyleSheet("background: transparent; border: 0px;")
         self.chart_view.setRenderHint(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.SmoothPixmapTransform)
+        # The chart changes as a whole with every update. Thus, the item index
+        # of the scene is not needed, and repainting the entire viewport is
+        # cheaper than computing the changed regions.
+        self.chart_view.scene().setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        self.chart_view.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing)
+        self.chart_view.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
 
         layout = QVBoxLayout()
         layout.addWidget(self.chart_view)
@@ -64,64 +90,118 @@ class LineChart(QWidget):
 
 
     def add_point(self, x: float = 0, y: float = 0):
-        """Add a point to the chart. None values are ignored."""
+        """Add a point to the chart. None values are ignored.
+
+        The chart is not updated immediately. Points added in quick succession
+        are collected and added to the chart at once by a timer (see
+        flush_pending_points()).
+        """
         if x is None or y is None:
             return
+        if len(self.points) == self.window_size:
+            self.evicted_points.append(self.points[0])
         self.points.append((x, y))
-        self.update_chart()
+        self.pending_points.append((x, y))
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+
+    def flush_pending_points(self):
+        """Add the pending points to the chart.
+
+        If the pending points lie within the current y range (and no point at
+        the border of the y range has been evicted), the normalization of the
+        existing points does not change. In that case, only the new points are
+        appended to the series and the evicted points are removed from it.
+        Otherwise, the chart is rebuilt by calling update_chart().
+        """
+        if not self.pending_points:
+            return
+        pending_points = self.pending_points
+        evicted_points = self.evicted_points
+        self.pending_points = []
+        self.evicted_points = []
+
+        min_y, max_y = self.min_y, self.max_y
+        if (self.series.count() == 0
+                or len(evicted_points) > self.series.count()
+                or not all(min_y <= y <= max_y for _, y in pending_points)
+                or not all(min_y < y < max_y for _, y in evicted_points)):
+            self.update_chart()
+            return
+
+        if evicted_points:
+            self.series.removePoints(0, len(evicted_points))
+        xs = [x for x, _ in self.points]
+        min_x, max_x = min(xs), max(xs)
+        if (min_x, max_x) != (self.min_x, self.max_x):
+            self.min_x, self.max_x = min_x, max_x
+            self.chart.axisX().setRange(min_x, max_x)
+        y_range = max_y - min_y if max_y != min_y else 1
+        self.series.append([QPointF(x, (y - min_y) / y_range) for x, y in pending_points])
 
 
     def clear(self):
         """Clear the chart."""
-        self.points = []
+        self.points.clear()
         self.update_chart()
 
 
     def set_background_color(self, color: QColor):
         """Set the background color of the chart."""
         self.background_color = color
-        self.update_chart()
+        self.chart.setBackgroundBrush(color)
 
 
     def set_line_color(self, color: QColor):
         """Set the color of the line."""
         self.line_color = color
-        self.update_chart()
+        self.update_pen()
 
 
     def set_line_width(self, width: float):
         """Set the width of the line."""
         self.line_width = width
-        self.update_chart()
+        self.update_pen()
 
 
     def set_points(self, points: List[Tuple[float, float]]):
         """Set the points of the chart. None values are ignored."""
-        self.points = [(x, y) for x, y in points if x is not None and y is not None]
+        self.points = deque(((x, y) for x, y in points if x is not None and y is not None), maxlen=self.window_size)
+        self.update_chart()
+
+
+    def set_window_size(self, window_size: int):
+        """Set the maximum number of points shown in the chart (only the most recent points are kept)."""
+        self.window_size = window_size
+        self.points = deque(self.points, maxlen=window_size)
         self.update_chart()
 
 
     def update_chart(self):
         """Update the chart with the current points."""
         self.series.clear()
+        self.pending_points = []  # all points are taken into account below
+        self.evicted_points = []
 
         if not self.points:
             return
 
+        xs, ys = zip(*self.points)
+        self.min_x, self.max_x = min(xs), max(xs)
+        self.min_y, self.max_y = min(ys), max(ys)
+        min_y = self.min_y
+        y_range = self.max_y - min_y if self.max_y != min_y else 1
+        self.chart.axisX().setRange(self.min_x, self.max_x)
+        # Pass all points at once; appending them one by one would trigger an update of the series for each point.
+        self.series.replace([QPointF(x, (y - min_y) / y_range) for x, y in self.points])
+
+
+    def update_pen(self):
+        """Update the pen of the series with the current line color and width."""
         pen = QPen(self.line_color)
         pen.setWidth(self.line_width)
         self.series.setPen(pen)
-        self.chart.setBackgroundBrush(self.background_color)
-        self.chart.setBackgroundRoundness(0)
-        min_x = min(x for x, _ in self.points)
-        max_x = max(x for x, _ in self.points)
-        min_y = min(y for _, y in self.points)
-        max_y = max(y for _, y in self.points)
-        y_range = max_y - min_y if max_y != min_y else 1
-        self.chart.axisX().setRange(min_x, max_x)
-        self.chart.axisY().setRange(-0.2, 1.2)
-        for (x, y) in self.points:
-            self.series.append(QPointF(x, (y - min_y) / y_range))
 
 
 def main():
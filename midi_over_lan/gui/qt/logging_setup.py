@@ -14,11 +14,13 @@ Public API:
 # pylint: disable=line-too-long
 # pylint: disable=invalid-name
 
+import json
 import logging
 import logging.handlers
 import multiprocessing
-import os
+import queue
 import threading
+import time
 import warnings
 
 import midi_over_lan.logging_setup
@@ -26,37 +28,172 @@ import midi_over_lan.logging_setup
 logger_thread = None
 
 
+# The encoder is created once and reused for all records. It escapes all
+# characters that must be escaped in JSON strings (including backslashes and
+# control characters) in C.
+_json_encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ': ')).encode
+
+
 class JsonLinesFormatter(logging.Formatter):
     """A custom JSON line formatter."""
 
+    MAXIMUM_NUMBER_OF_CACHED_ORIGINS = 1024
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the formatter; the arguments are passed to logging.Formatter."""
+        super().__init__(*args, **kwargs)
+        self.cached_time = (None, '')  # (seconds since the epoch, formatted time without milliseconds)
+        self.cached_origins: dict[tuple, str] = {}  # key is (name, process, processName, thread, threadName, taskName); value is the encoded tail of the JSON line
+
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record as a JSON line."""
-        # From record.filename, extract only the file name without the path.
-        filename = os.path.basename(record.filename)
-        message = record.getMessage().replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
-        output_string = f'{{"asctime": "{self.formatTime(record, self.datefmt)}",' \
-                        f'"filename": "{filename}",' \
-                        f'"funcName": "{record.funcName}",' \
-                        f'"levelname": "{record.levelname}",' \
-                        f'"levelno": "{record.levelno}",' \
-                        f'"lineno": "{record.lineno}",' \
-                        f'"message": "{message}",' \
-                        f'"module": "{record.module}",' \
-                        f'"msecs": "{record.msecs}",' \
-                        f'"name": "{record.name}",' \
-                        f'"process": "{record.process}",' \
-                        f'"processName": "{record.processName}",' \
-                        f'"thread": "{record.thread}",' \
-                        f'"threadName": "{record.threadName}",' \
-                        f'"taskName": "{record.taskName}"}}'
-                        # f'"pathname": "{record.pathname}",' \
-        return output_string
-
-
-jsonl_handler = logging.handlers.RotatingFileHandler("log messages.jsonl", encoding="utf-8", maxBytes=1000000, backupCount=5)
+        # The last fields of the line (logger, process, thread, and task) are
+        # the same for all records of a logger within a thread; they are
+        # encoded once and cached.
+        task_name = getattr(record, 'taskName', None)  # taskName exists as of Python 3.12
+        key = (record.name, record.process, record.processName, record.thread, record.threadName, task_name)
+        tail = self.cached_origins.get(key)
+        if tail is None:
+            if len(self.cached_origins) >= self.MAXIMUM_NUMBER_OF_CACHED_ORIGINS:
+                self.cached_origins.clear()
+            tail = _json_encode({"name": record.name,
+                                 "process": str(record.process),
+                                 "processName": str(record.processName),
+                                 "thread": str(record.thread),
+                                 "threadName": str(record.threadName),
+                                 "taskName": str(task_name)})[1:]  # without the opening brace
+            self.cached_origins[key] = tail
+        # Note: record.filename is already the file name without the path (the
+        # LogRecord derives it from record.pathname when it is created).
+        # All values are written as strings.
+        head = _json_encode({"asctime": self.formatTime(record, self.datefmt),
+                             "filename": record.filename,
+                             "funcName": str(record.funcName),
+                             "levelname": record.levelname,
+                             "levelno": str(record.levelno),
+                             "lineno": str(record.lineno),
+                             "message": record.getMessage(),
+                             "module": record.module,
+                             "msecs": str(record.msecs)})[:-1]  # without the closing brace
+        return head + ',' + tail
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """Return the creation time of the record as a string.
+
+        Without a date format, the result equals that of logging.Formatter, but
+        the time is only formatted once per second; the milliseconds are added
+        to the cached string.
+        """
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        seconds = int(record.created)
+        cached_seconds, cached_string = self.cached_time
+        if seconds != cached_seconds:
+            cached_string = time.strftime(self.default_time_format, self.converter(seconds))
+            self.cached_time = (seconds, cached_string)
+        return self.default_msec_format % (cached_string, record.msecs)
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """A rotating file handler that writes the log records in batches.
+
+    The formatted records are collected in a buffer, which is written to the
+    file with a single write call when it holds `capacity` records or when
+    flush() is called. The rollover is checked once per batch; thus, a file may
+    exceed maxBytes by up to one batch.
+    """
+
+    def __init__(self, *args, capacity: int = 512, **kwargs):
+        """Initialize the handler; the arguments are passed to RotatingFileHandler."""
+        super().__init__(*args, **kwargs)
+        self.capacity = capacity
+        self.buffer: list[str] = []  # formatted log records (including the terminator)
+
+    def close(self):
+        """Write the buffered records to the file and close it."""
+        self.flush()
+        super().close()
+
+    def emit(self, record: logging.LogRecord):
+        """Format the record and add it to the buffer."""
+        try:
+            self.buffer.append(self.format(record) + self.terminator)
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+            return
+        if len(self.buffer) >= self.capacity:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered records to the file."""
+        with self.lock:
+            if not self.buffer:
+                return
+            text = ''.join(self.buffer)
+            self.buffer.clear()
+            try:
+                if self.stream is None:
+                    self.stream = self._open()
+                if self.maxBytes > 0:
+                    self.stream.seek(0, 2)
+                    if self.stream.tell() and self.stream.tell() + len(text) >= self.maxBytes:
+                        self.doRollover()
+                self.stream.write(text)
+                self.stream.flush()
+            except Exception:  # pylint: disable=broad-except
+                self.handleError(None)
+
+
+class LoggerLevelFilter(logging.Filter):
+    """A logging filter that drops records below a given level from the given loggers.
+
+    The filter applies to the named loggers and their child loggers; records of
+    other loggers pass the filter.
+    """
+
+    def __init__(self, names: tuple[str, ...], level: int):
+        """Initialize the filter with the logger names and the minimum level."""
+        super().__init__()
+        self.names = names
+        self.prefixes = tuple(name + '.' for name in names)
+        self.level = level
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return False if the record is below the level and stems from one of the loggers."""
+        if record.levelno >= self.level:
+            return True
+        return not (record.name in self.names or record.name.startswith(self.prefixes))
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """A queue listener that flushes its handlers once the queue is empty."""
+
+    def handle(self, record: logging.LogRecord):
+        """Handle the record and flush the handlers if no more records are waiting."""
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+
+jsonl_handler = BufferedRotatingFileHandler("log messages.jsonl", encoding="utf-8", maxBytes=1000000, backupCount=5)
 jsonl_handler.setFormatter(JsonLinesFormatter())
 jsonl_handler.setLevel(logging.DEBUG)
 
+# The JSONL file is written by a queue listener thread; thus, formatting, file
+# I/O, and rotation do not block the threads that emit the log messages. Bursts
+# of log records are written to the file at once.
+jsonl_queue = queue.SimpleQueue()
+jsonl_listener = BatchingQueueListener(jsonl_queue, jsonl_handler, respect_handler_level=True)
+jsonl_queue_handler = logging.handlers.QueueHandler(jsonl_queue)
+jsonl_queue_handler.setLevel(jsonl_handler.level)  # do not copy and enqueue records the JSONL handler would discard
+
+# The worker processes log debug messages for each MIDI message and packet;
+# by default, these are not written to the JSONL file (see activate_logging_jsonl()).
+WORKER_LOGGER_NAMES = ('midi_over_lan.sender', 'midi_over_lan.receiver')
+jsonl_worker_filter = LoggerLevelFilter(WORKER_LOGGER_NAMES, logging.INFO)
+jsonl_queue_handler.addFilter(jsonl_worker_filter)
+
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s  %(levelname)s  %(module)-15s  line %(lineno)-4d  %(message)s')
 
@@ -65,10 +202,24 @@ logger = logging.getLogger("MIDI over LAN GUI")
 logger.setLevel(logging.DEBUG)
 
 
-def activate_logging_jsonl():
-    """Activate the JSONL logging handler."""
+def activate_logging_jsonl(level: int = logging.DEBUG, worker_level: int = logging.INFO):
+    """Activate the JSONL logging handler.
+
+    The log records are passed to the JSONL handler via a queue and written to
+    the file by a separate listener thread, which is stopped by
+    stop_logger_thread(). Records below the given level are discarded before
+    they are put into the queue. The same holds for records of the worker
+    processes (see WORKER_LOGGER_NAMES) below worker_level; pass logging.DEBUG
+    to include the per-message debug output of the workers.
+    """
+    jsonl_handler.setLevel(level)
+    jsonl_queue_handler.setLevel(level)
+    jsonl_worker_filter.level = worker_level
     root = logging.getLogger()
-    root.addHandler(jsonl_handler)
+    if jsonl_queue_handler in root.handlers:
+        return
+    root.addHandler(jsonl_queue_handler)
+    jsonl_listener.start()
 
 
 def start_logger_thread(log_queue:multiprocessing.Queue):
@@ -80,9 +231,9 @@ def start_logger_thread(log_queue:multiprocessing.Queue):
     created in main process and then be passed to this function. The logger
     thread should also run in the main process.
 
-    If the queue is full, the worker processes will block until the logger thread
-    has processed some log messages. This is why the function should be called
-    as early as possible.
+    If the queue is full, the worker processes drop their oldest log messages
+    instead of blocking. This is why the function should be called as early as
+    possible.
 
     The worker processes do call the init_logger() function from the
     midi_over_lan.logging_setup module to set up the logger. This function
@@ -112,3 +263,8 @@ def stop_logger_thread(log_queue:multiprocessing.Queue) -> None:
         logger_thread.join()
     else:
         warnings.warn("Logger thread was not started. Nothing to stop.")
+    root = logging.getLogger()
+    if jsonl_queue_handler in root.handlers:
+        root.removeHandler(jsonl_queue_handler)
+        jsonl_listener.stop()
+        jsonl_handler.flush()  # write the remaining log records to the file
@@ -78,8 +78,8 @@ def main():
     """Main function."""
 
     # Create a queue for the log messages. The log_queue has a maximum size of
-    # 10000 messages. If the queue is full, the worker processes will block
-    # until the main process has processed some log messages. Thus, the
+    # 10000 messages. If the queue is full, the worker processes drop their
+    # oldest log messages (they never block on logging). Thus, the
     # logger_thread should be created as early as possible.
     log_queue = multiprocessing.Queue(maxsize=10000)
 
@@ -17,26 +17,27 @@
 # pylint: disable=pointless-string-statement
 # pylint: disable=wrong-import-position
 # pylint: disable=wrong-import-order
-# pylint: disable=logging-fstring-interpolation
 # pylint: disable=invalid-name
 
 import logging
 import multiprocessing
 import platform
+import threading
 import time
 from collections import deque
-from functools import cache
-from socket import gethostbyaddr, gethostname
-from statistics import median
-from typing import List, Tuple
+from itertools import compress
+from queue import Empty
+from socket import gethostbyaddr
+from typing import List
 
 import mido
-from PySide6.QtCore import Qt, QTimerEvent
-from PySide6.QtGui import QColor, QKeySequence, QShortcut
+from PySide6.QtCore import QSignalBlocker, QSocketNotifier, Qt, QTimer
+from PySide6.QtGui import QBrush, QColor, QKeySequence, QShortcut
 from PySide6.QtWidgets import QHeaderView, QLabel, QMainWindow, QMessageBox, QTableWidgetItem
 
 from midi_over_lan.worker_messages import Command, CommandMessage, Information, InfoMessage
 from ui_main_window import Ui_MainWindow
+from background_task import run_in_background
 from line_chart import LineChart
 from version import VERSION
 from debug_messages_dialog import DebugMessagesDialog, LoggingHandler
@@ -45,35 +46,115 @@ from settings_dialog import SettingsDialog
 
 logger=logging.getLogger('midi_over_lan.gui')  # pylint: disable=invalid-name
 
+IS_WINDOWS = platform.system() == 'Windows'
+
+# Appearance of the items in the input ports table (created once and shared by all items).
+# The device name items are the default items without the editable and selectable flags.
+DEVICE_NAME_ITEM_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsUserCheckable | Qt.ItemIsDragEnabled | Qt.ItemIsDropEnabled
+PORT_IN_USE_BRUSH = QBrush(QColor("red"))
+PORT_IN_USE_TOOLTIP = "The input port is already in use by another application."
+
 
 ##################################################################################################
 # Helper functions
 ##################################################################################################
 
-@cache
-def get_hostname(string: str) -> str:
-    """Get the hostname for the given string.
+HOSTNAME_CACHE_TIMEOUT = 300.0  # seconds
+HOSTNAME_CACHE_TIMEOUT_FAILURE = 30.0  # seconds; failed lookups are retried sooner
+_hostname_cache: dict[str, tuple[float, str]] = {}  # key is the IP address; value is (expiry time, hostname)
+
+
+def get_cached_hostname(ip_address: str) -> str | None:
+    """Return the cached hostname of the IP address or None if there is no valid cache entry."""
+    cached = _hostname_cache.get(ip_address)
+    if cached is None or time.monotonic() >= cached[0]:
+        return None
+    return cached[1]
 
-    The string can be either a hostname or an IPv4 address.
+
+def get_hostname(ip_address: str) -> str:
+    """Get the hostname for the given IPv4 address by a reverse lookup.
+
+    If the lookup fails, the IP address itself is returned. The results are
+    cached for HOSTNAME_CACHE_TIMEOUT seconds (HOSTNAME_CACHE_TIMEOUT_FAILURE
+    seconds in case of a failure). Note, the lookup may block for several
+    seconds; thus, it should be run in the background (see lookup_hostname()).
     """
     try:
-        name = gethostbyaddr(string)[0]
+        hostname = gethostbyaddr(ip_address)[0]
+        timeout = HOSTNAME_CACHE_TIMEOUT
     except Exception:  # pylint: disable=broad-except
-        try:
-            name = gethostname()
-        except Exception:  # pylint: disable=broad-except
-            name = 'unknown'
-    return name
+        hostname = ip_address
+        timeout = HOSTNAME_CACHE_TIMEOUT_FAILURE
+    _hostname_cache[ip_address] = (time.monotonic() + timeout, hostname)
+    return hostname
+
+
+def lookup_hostname(ip_address: str) -> tuple[str, str]:
+    """Return the IP address and its hostname (see get_hostname()); used for lookups in the background."""
+    return ip_address, get_hostname(ip_address)
+
+
+# The MIDI backends are not documented to be thread-safe. Since the MIDI ports
+# are probed and enumerated in the background as well as in the GUI thread, the
+# calls of the backend are serialized by this lock.
+_midi_backend_lock = threading.Lock()
+
+OUTPUT_PORT_NAMES_CACHE_TIMEOUT = 0.5  # seconds
+_output_port_names_cache: tuple[float, List[str]] = (float('-inf'), [])  # (timestamp, output port names)
+
+
+def get_output_port_names(max_age: float = OUTPUT_PORT_NAMES_CACHE_TIMEOUT) -> List[str]:
+    """Return the names of the local MIDI output ports.
+
+    Enumerating the ports queries the MIDI backend, which may take a while.
+    Since the routing matrix is refreshed for each update of the remote MIDI
+    devices, the result is cached. Cached names older than max_age seconds are
+    not used; thus, a max_age of 0 enumerates the ports in any case.
+    """
+    global _output_port_names_cache  # pylint: disable=global-statement
+    with _midi_backend_lock:
+        now = time.monotonic()
+        timestamp, names = _output_port_names_cache
+        if now - timestamp >= max_age:
+            names = mido.get_output_names()  # pylint: disable=no-member
+            _output_port_names_cache = (now, names)
+    return names
+
+
+INPUT_PORT_IN_USE_CACHE_TIMEOUT = 2.0  # seconds
+_input_port_in_use_cache: dict[str, tuple[float, bool]] = {}  # key is the port name; value is (timestamp, port in use)
 
 
 def is_input_port_in_use(port_name: str) -> bool:
-    """Check if a MIDI input port is already open."""
+    """Check if a MIDI input port is already open.
+
+    Probing a port requires opening and closing it, which is slow. Thus, the
+    result is cached for INPUT_PORT_IN_USE_CACHE_TIMEOUT seconds.
+    """
+    now = time.monotonic()
+    if cached := _input_port_in_use_cache.get(port_name):
+        timestamp, in_use = cached
+        if now - timestamp < INPUT_PORT_IN_USE_CACHE_TIMEOUT:
+            return in_use
     try:
-        with mido.open_input(port_name):  # pylint: disable=no-member
-            return False  # if the port can be opened, it is not open
+        with _midi_backend_lock, mido.open_input(port_name):  # pylint: disable=no-member
+            in_use = False  # if the port can be opened, it is not open
     except IOError:
         # in case of an IOError, the port is probably already open
-        return True
+        in_use = True
+    _input_port_in_use_cache[port_name] = (now, in_use)
+    return in_use
+
+
+def probe_input_ports(port_names: List[str]) -> dict[str, bool]:
+    """Check for each of the MIDI input ports whether it is already open.
+
+    The ports are probed one after another, since the MIDI backends are not
+    documented to be safe for opening ports from several threads at once. The
+    results are cached (see is_input_port_in_use()).
+    """
+    return {port_name: is_input_port_in_use(port_name) for port_name in port_names}
 
 
 ##################################################################################################
@@ -94,13 +175,23 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.ui_queue = ui_queue
         self.sender_paused = False
         self.receiver_paused = False
-        self.input_ports: List[Tuple[bool, str, str]] = []  # List of tuples (active, device_name, network_name)
+        # The input ports are stored column-wise, i.e., row i of the table widget
+        # corresponds to index i of the following lists.
+        self.input_ports_active: List[bool] = []  # active states of the input ports
+        self.input_ports_device_names: List[str] = []  # device names of the input ports
+        self.input_ports_network_names: List[str] = []  # user-defined network names of the input ports
+        self.input_ports_rows: dict[str, int] = {}  # key is the device name; value is the row of the input port
         self.local_output_ports: List[str] = []
         self.remote_midi_devices: dict[str, set[str]] = {}  # key is remote ip address or hostname; values are the user-defined network names of the remote MIDI devices
+        self.routing_matrix_output_ports: set[str] | None = None  # remote MIDI device names last passed to the routing matrix
+        self.routing_matrix_input_ports: List[str] | None = None  # local output port names last passed to the routing matrix
         self.routing_connections: dict[str, set[str]] = {}  # key is the network name of the MIDI device; values are the local output port names to which the MIDI data should be sent
+        self.round_trip_times_rows: dict[str, int] = {}  # key is the IP address of the remote host; value is the row in the round trip times table
+        self.round_trip_times_charts: dict[str, LineChart] = {}  # key is the IP address of the remote host; value is the line chart shown in its row
+        self.pending_hostname_lookups: set[str] = set()  # IP addresses whose hostnames are being looked up
 
-        # Set the style sheet of the label to indicate that the server is running.
-        self.label_OutgoingTraffic_ServerStatus.setStyleSheet("background-color: green;\nborder: 1px solid gray;\nborder-radius: 10px;")
+        # Set the status indicator to indicate that the server is running.
+        self.label_OutgoingTraffic_ServerStatus.set_running(True)
 
         # Set up the table widget.
         self.tableWidget_LocalInputPorts.clearSelection()
@@ -110,6 +201,20 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.tableWidget_LocalInputPorts.setSortingEnabled(False)
         self.tableWidget_LocalInputPorts.itemChanged.connect(self.update_network_names)
 
+        # Changes of the input ports in quick succession (e.g., toggling several
+        # ports) are sent to the sender process at once (see schedule_sending_input_ports()).
+        self.send_input_ports_timer = QTimer(self)
+        self.send_input_ports_timer.setInterval(50)  # 50 ms
+        self.send_input_ports_timer.setSingleShot(True)
+        self.send_input_ports_timer.timeout.connect(self.send_input_ports_to_worker_process)
+
+        # The sending process acknowledges a restart with a SENDER_READY message;
+        # a warning is logged if the acknowledgement does not arrive in time.
+        self.restart_timeout_timer = QTimer(self)
+        self.restart_timeout_timer.setInterval(3000)  # 3000 ms
+        self.restart_timeout_timer.setSingleShot(True)
+        self.restart_timeout_timer.timeout.connect(self.handle_restart_timeout)
+
         # Connect the GUI elements in the `Outgoing Traffic` tab to the functions.
         self.pushButton_LocalInputPorts_SelectAll.clicked.connect(self.select_all_input_ports)
         self.pushButton_LocalInputPorts_UnselectAll.clicked.connect(self.unselect_all_input_ports)
@@ -125,7 +230,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.pushButton_RoutingMatrix_Clear.clicked.connect(self.clear_routing_matrix)
         self.pushButton_RoutingMatrix_SelectAll.clicked.connect(self.stackedWidget_RoutingMatrix.select_all)
         self.pushButton_RoutingMatrix_UnselectAll.clicked.connect(self.stackedWidget_RoutingMatrix.unselect_all)
-        self.pushButton_RoutingMatrix_Refresh.clicked.connect(self.refresh_routing_matrix)
+        self.pushButton_RoutingMatrix_Refresh.clicked.connect(self.refresh_routing_matrix_now)
 
         # Set up the dialogs (preferences, debug messages dialog, etc.) now, as they are referenced below.
         self.setup_dialogs()
@@ -134,13 +239,13 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.action_Quit.triggered.connect(self.close)
         self.action_Preferences.triggered.connect(self.show_settings_dialog)
         self.actionShow_Debug_Messages.triggered.connect(self.show_debug_messages_dialog)
-        self.action_About.triggered.connect(lambda: QMessageBox.information(self, "About", f"MIDI over LAN\nVersion {VERSION}\n(c) 2025 Christoph Hänisch"))
+        self.action_About.triggered.connect(self.show_about_dialog)
 
         # Add global shortcuts.
         self.shortcut_Quit = QShortcut(QKeySequence("Ctrl+Q"), self)
         self.shortcut_Quit.activated.connect(self.close)
         self.shortcut_Help = QShortcut(QKeySequence("F1"), self)
-        self.shortcut_Help.activated.connect(lambda: QMessageBox.information(self, "About", f"MIDI over LAN\nVersion {VERSION}\n(c) 2025 Christoph Hänisch"))
+        self.shortcut_Help.activated.connect(self.show_about_dialog)
         self.shortcut_Preferences = QShortcut(QKeySequence("Ctrl+P"), self)
         self.shortcut_Preferences.activated.connect(self.show_settings_dialog)
         self.shortcut_DebugMessagesDialog = QShortcut(QKeySequence("Ctrl+SHIFT+D"), self)
@@ -151,9 +256,16 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.refresh_output_ports()
         self.refresh_routing_matrix()
 
-        # Process the UI message queue every second.
-        self.timer = self.startTimer(1000)  # 1000 ms
-        self.timerEvent = self.process_ui_message_queue
+        # Process the UI message queue. Except for Windows, the pipe underlying
+        # the queue is watched by a socket notifier; thus, the messages are
+        # processed as soon as they arrive and nothing runs while the queue is
+        # idle. On Windows, the queue is polled every second.
+        if not IS_WINDOWS:
+            self.ui_queue_notifier = QSocketNotifier(self.ui_queue._reader.fileno(), QSocketNotifier.Type.Read, self)  # pylint: disable=protected-access
+            self.ui_queue_notifier.activated.connect(self.process_ui_message_queue)
+        else:
+            self.timer = self.startTimer(1000)  # 1000 ms
+            self.timerEvent = self.process_ui_message_queue
 
         # Initialization finished.
         self.statusbar.addWidget(QLabel("   Ready   "))
@@ -161,23 +273,22 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
     def add_input_port(self, active: bool, device_name: str, network_name: str):
         """Add the given input port to the table widget and to the internal list of input ports."""
-        logger.debug(f"Add input port: {device_name} ({network_name})")
+        logger.debug("Add input port: %s (%s)", device_name, network_name)
         # Skip if the port is already in the list.
-        for port in self.input_ports:
-            if port[1] == device_name:
-                return
-        self.input_ports.append((active, device_name, network_name))
-        self.tableWidget_LocalInputPorts.setRowCount(len(self.input_ports))
-        row = len(self.input_ports) - 1
+        if device_name in self.input_ports_rows:
+            return
+        row = len(self.input_ports_device_names)
+        self.input_ports_rows[device_name] = row
+        self.input_ports_active.append(active)
+        self.input_ports_device_names.append(device_name)
+        self.input_ports_network_names.append(network_name)
+        if row >= self.tableWidget_LocalInputPorts.rowCount():
+            self.tableWidget_LocalInputPorts.setRowCount(row + 1)
         item = QTableWidgetItem(device_name)
         item.setCheckState(Qt.Checked if active else Qt.Unchecked)
-        item.setFlags(item.flags() & ~Qt.ItemIsEditable & ~Qt.ItemIsSelectable)
+        item.setFlags(DEVICE_NAME_ITEM_FLAGS)
         self.tableWidget_LocalInputPorts.setItem(row, 0, item)
         self.tableWidget_LocalInputPorts.setItem(row, 1, QTableWidgetItem(network_name))
-        if is_input_port_in_use(device_name):
-            logger.info(f"Port {device_name} is already in use.")
-            item.setForeground(Qt.red)
-            item.setToolTip("The input port is already in use by another application.")
 
 
     def clear_routing_matrix(self):
@@ -186,9 +297,16 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.receiver_queue.put(CommandMessage(Command.CLEAR_STORED_REMOTE_MIDI_DEVICES))
         self.remote_midi_devices.clear()
         self.stackedWidget_RoutingMatrix.clear()
+        self.routing_matrix_output_ports = None
+        self.routing_matrix_input_ports = None
         self.refresh_routing_matrix()
 
 
+    def handle_restart_timeout(self):
+        """Warn that the sending process has not acknowledged the restart in time."""
+        logger.warning('The sending process did not acknowledge the restart.')
+
+
     def keyPressEvent(self, event):  # pylint: disable=invalid-name
         """Handle key press events. In particular, show the menu bar when the Alt key is pressed."""
         if event.key() == Qt.Key_Alt:
@@ -205,8 +323,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         """Pause the sending process."""
         logger.debug('Pause the sending process.')
         self.sender_queue.put(CommandMessage(Command.PAUSE))
-        # Set the style sheet of the label to indicate that the server is paused.
-        self.label_OutgoingTraffic_ServerStatus.setStyleSheet("background-color: red;\nborder: 1px solid gray;\nborder-radius: 10px;")
+        # Set the status indicator to indicate that the server is paused.
+        self.label_OutgoingTraffic_ServerStatus.set_running(False)
 
 
     def pause_and_resume_sending_process(self):
@@ -220,45 +338,96 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             self.sender_paused = True
 
 
-    def process_ui_message_queue(self, event: QTimerEvent):
-        """Process the UI message queue every second."""
-        while not self.ui_queue.empty():
-            message = self.ui_queue.get()
+    def process_ui_message_queue(self, *_):
+        """Process all messages in the UI message queue.
+
+        The arguments (the timer event or the socket of the socket notifier)
+        are ignored.
+
+        The round trip times and the remote MIDI devices are sent as complete
+        snapshots. Thus, if several of them are waiting in the queue, only the
+        latest round trip times are shown and the routing matrix is refreshed
+        once for all remote MIDI device updates.
+        """
+        round_trip_times = None
+        remote_midi_devices_changed = False
+        while True:
+            try:
+                message = self.ui_queue.get_nowait()
+            except Empty:
+                break
             if isinstance(message, InfoMessage):
                 if message.info == Information.ROUND_TRIP_TIMES:
-                    logger.debug('Got a message update for the round trip times.')
-                    self.update_round_trip_times(message.data)
+                    round_trip_times = message.data
                     continue
                 if message.info == Information.REMOTE_MIDI_DEVICES:
-                    logger.debug('Got a message update for the remote MIDI devices.')
                     self.remote_midi_devices |= message.data  # merge the new remote MIDI devices with the existing ones
-                    logger.debug(f"Remote MIDI devices: {self.remote_midi_devices}")
-                    self.refresh_routing_matrix()
+                    remote_midi_devices_changed = True
+                    continue
+                if message.info == Information.SENDER_READY:
+                    logger.debug('The sending process is ready.')
+                    self.restart_timeout_timer.stop()
+                    if not self.sender_paused:  # a paused sender stays red
+                        # Set the status indicator to indicate that the server is running.
+                        self.label_OutgoingTraffic_ServerStatus.set_running(True)
                     continue
-            else:
-                logger.warning(f"Unexpected or unknown message: {message}")
+            logger.warning("Unexpected or unknown message: %s", message)
+
+        if round_trip_times is not None:
+            logger.debug('Got a message update for the round trip times.')
+            self.update_round_trip_times(round_trip_times)
+        if remote_midi_devices_changed:
+            logger.debug('Got a message update for the remote MIDI devices.')
+            logger.debug("Remote MIDI devices: %s", self.remote_midi_devices)
+            self.refresh_routing_matrix()
 
 
     def refresh_input_ports(self):
         """Refresh the list of internal input ports."""
         logger.debug('Refresh the list of input ports.')
-        self.tableWidget_LocalInputPorts.clearContents()
-        self.input_ports = []
-        for input_port in mido.get_input_names():
-            if platform.system() == 'Windows':
-                input_port = input_port.split(':')[0]
-            self.add_input_port(False, input_port, input_port)
-
-
-    def refresh_output_ports(self):
-        """Refresh the list of internal output ports."""
+        with _midi_backend_lock:
+            input_port_names = mido.get_input_names()
+        if IS_WINDOWS:
+            input_port_names = [input_port.partition(':')[0] for input_port in input_port_names]
+        input_port_names = list(dict.fromkeys(input_port_names))  # remove duplicates, keep the order
+
+        # Fill the table widget without repainting it for each row and without
+        # emitting the itemChanged signal for each item (which would send the
+        # input ports to the worker process each time).
+        table = self.tableWidget_LocalInputPorts
+        table.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(table):
+                table.clearContents()
+                table.setRowCount(len(input_port_names))
+                self.input_ports_active.clear()
+                self.input_ports_device_names.clear()
+                self.input_ports_network_names.clear()
+                self.input_ports_rows.clear()
+                for input_port in input_port_names:
+                    self.add_input_port(False, input_port, input_port)
+        finally:
+            table.setUpdatesEnabled(True)
+        self.schedule_sending_input_ports()
+
+        # Probing whether the ports are in use requires opening them, which may
+        # take a while. Thus, it is done in the background; the ports in use are
+        # marked by show_input_ports_in_use() when the results arrive.
+        run_in_background(probe_input_ports, input_port_names, on_finished=self.show_input_ports_in_use)
+
+
+    def refresh_output_ports(self, max_age: float = OUTPUT_PORT_NAMES_CACHE_TIMEOUT):
+        """Refresh the list of internal output ports.
+
+        The ports are enumerated in the background (see get_output_port_names()
+        for the meaning of max_age); the routing matrix is updated by
+        show_output_ports() when the port names arrive.
+        """
         logger.debug('Refresh the list of output ports.')
-        self.local_output_ports.clear()
-        for output_port in mido.get_output_names():
-            self.local_output_ports.append(output_port.split(':')[0])
+        run_in_background(get_output_port_names, max_age, on_finished=self.show_output_ports)
 
 
-    def refresh_routing_matrix(self):
+    def refresh_routing_matrix(self, max_age: float = OUTPUT_PORT_NAMES_CACHE_TIMEOUT):
         """Update/refresh the routing matrix."""
         logger.debug('Refresh/update the routing matrix.')
         # Set up the routing matrix.
@@ -266,45 +435,58 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         #       (1) routing matrix's output port = remote/network device
         #       (2) routing matrix's input port = local output device / local output port
 
+        # The routing matrix rebuilds its table and emits the connections_changed
+        # signal whenever the ports are set; thus, the ports are only set if
+        # they have changed (e.g., not for each update of the remote MIDI devices).
+
         # (1)
-        remote_device_names = set()
-        for device_names in self.remote_midi_devices.values():
-            for device_name in device_names:
-                remote_device_names.add(device_name)
-        self.stackedWidget_RoutingMatrix.set_output_ports(list(remote_device_names))
+        remote_device_names = set().union(*self.remote_midi_devices.values())
+        if remote_device_names != self.routing_matrix_output_ports:
+            self.routing_matrix_output_ports = remote_device_names
+            self.stackedWidget_RoutingMatrix.set_output_ports(list(remote_device_names))
 
         # (2)
-        self.refresh_output_ports()  # Ensure the local output ports are up to date.
-        self.stackedWidget_RoutingMatrix.set_input_ports(self.local_output_ports)
+        self.refresh_output_ports(max_age)  # Ensure the local output ports are up to date.
+
+
+    def refresh_routing_matrix_now(self):
+        """Refresh the routing matrix on request of the user, i.e., without using cached port names."""
+        self.refresh_routing_matrix(max_age=0)
 
 
     def restart_sending_process(self):
-        """Restart the processing loop of the sending process."""
+        """Restart the processing loop of the sending process.
+
+        The status label is set back to green once the sending process
+        acknowledges the restart (see process_ui_message_queue()).
+        """
         logger.debug('Restart the sending process.')
-        # Set the style sheet of the label to indicate that the server is shut down.
-        self.label_OutgoingTraffic_ServerStatus.setStyleSheet("background-color: red;\nborder: 1px solid gray;\nborder-radius: 10px;")
-        self.repaint()
+        # Set the status indicator to indicate that the server is shut down.
+        self.label_OutgoingTraffic_ServerStatus.set_running(False)
         self.sender_queue.put(CommandMessage(Command.RESTART))
-        time.sleep(1)
-        # Set the style sheet of the label to indicate that the server is running.
-        self.label_OutgoingTraffic_ServerStatus.setStyleSheet("background-color: green;\nborder: 1px solid gray;\nborder-radius: 10px;")
+        self.restart_timeout_timer.start()
 
 
     def resume_sending_process(self):
         """Resume the sending process."""
         logger.debug('Resume the sending process.')
         self.sender_queue.put(CommandMessage(Command.RESUME))
-        # Set the style sheet of the label to indicate that the server is running.
-        self.label_OutgoingTraffic_ServerStatus.setStyleSheet("background-color: green;\nborder: 1px solid gray;\nborder-radius: 10px;")
+        # Set the status indicator to indicate that the server is running.
+        self.label_OutgoingTraffic_ServerStatus.set_running(True)
 
 
     def routing_matrix_connections_changed(self, outputs: dict[str, set[str]], inputs: dict[str, set[str]]):
         """Handle the connections changed signal from the routing matrix."""
-        logger.debug(f'Routing matrix connections changed: {outputs}')
+        logger.debug('Routing matrix connections changed: %s', outputs)
         self.routing_connections = outputs  # Update the routing connections.
         self.receiver_queue.put(InfoMessage(Information.ROUTING_INFORMATION, self.routing_connections))
 
 
+    def show_about_dialog(self):
+        """Show the about dialog."""
+        QMessageBox.information(self, "About", f"MIDI over LAN\nVersion {VERSION}\n(c) 2025 Christoph Hänisch")
+
+
     def show_debug_messages_dialog(self):
         """Show the debug messages dialog."""
         logger.debug('Show debug messages dialog.')
@@ -312,6 +494,38 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.debug_messages_dialog.raise_()
 
 
+    def show_hostname(self, result: tuple[str, str]):
+        """Show the hostname of the remote host in the round trip times table."""
+        ip_address, hostname = result  # see lookup_hostname()
+        self.pending_hostname_lookups.discard(ip_address)
+        row = self.round_trip_times_rows.get(ip_address)
+        if row is None:
+            return
+        item = self.tableWidget_RTT.item(row, 0)
+        if item.text() != hostname:
+            item.setText(hostname)
+
+
+    def show_input_ports_in_use(self, in_use: dict[str, bool]):
+        """Mark the input ports that are already in use by another application."""
+        for device_name, port_in_use in in_use.items():
+            row = self.input_ports_rows.get(device_name)
+            if not port_in_use or row is None:  # the port may have vanished with a later refresh
+                continue
+            logger.info("Port %s is already in use.", device_name)
+            item = self.tableWidget_LocalInputPorts.item(row, 0)
+            item.setForeground(PORT_IN_USE_BRUSH)
+            item.setToolTip(PORT_IN_USE_TOOLTIP)
+
+
+    def show_output_ports(self, output_port_names: List[str]):
+        """Set the local output ports and pass them to the routing matrix if they have changed."""
+        self.local_output_ports[:] = [output_port.partition(':')[0] for output_port in output_port_names]
+        if self.local_output_ports != self.routing_matrix_input_ports:
+            self.routing_matrix_input_ports = list(self.local_output_ports)
+            self.stackedWidget_RoutingMatrix.set_input_ports(self.local_output_ports)
+
+
     def show_settings_dialog(self):
         """Show the settings dialog."""
         logger.debug('Show settings dialog.')
@@ -319,25 +533,35 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.settings_dialog.raise_()
 
 
+    def schedule_sending_input_ports(self):
+        """Send the list of active input ports to the sender process shortly.
+
+        All changes made until the timer expires are sent with a single message.
+        """
+        if not self.send_input_ports_timer.isActive():
+            self.send_input_ports_timer.start()
+
+
     def send_input_ports_to_worker_process(self):
         """Send the list of active input ports to the sender process."""
         logger.debug('Send input ports to the worker process.')
-        # The worker process expects a list of tuples (device_name, network_name).
-        # Note, that the active state is not used here (cf. the definition of
-        # self.input_ports). Thus, we filter the list accordingly and send only
-        # the desired format.
-        active_input_ports = [(item[1], item[2]) for item in self.input_ports if item[0]]
+        # The worker process expects a list of tuples (device_name, network_name)
+        # of the active input ports only.
+        active_input_ports = list(compress(zip(self.input_ports_device_names, self.input_ports_network_names), self.input_ports_active))
         self.sender_queue.put(CommandMessage(Command.SET_MIDI_INPUT_PORTS, active_input_ports))
 
 
     def select_all_input_ports(self):
         """Select all input ports."""
         logger.debug('Select all input ports.')
-        for row in range(self.tableWidget_LocalInputPorts.rowCount()):
-            item = self.tableWidget_LocalInputPorts.item(row, 0)
-            self.input_ports[row] = (True, self.input_ports[row][1], self.input_ports[row][2])
-            item.setCheckState(Qt.Checked)
-        self.send_input_ports_to_worker_process()
+        self.input_ports_active[:] = [True] * len(self.input_ports_active)
+        # Block the itemChanged signal of the table widget; changes of the check
+        # states are not handled by update_network_names() anyway.
+        with QSignalBlocker(self.tableWidget_LocalInputPorts):
+            for row in range(self.tableWidget_LocalInputPorts.rowCount()):
+                item = self.tableWidget_LocalInputPorts.item(row, 0)
+                item.setCheckState(Qt.Checked)
+        self.schedule_sending_input_ports()
 
 
     def setup_dialogs(self):
@@ -350,9 +574,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         # Set up the debug messages dialog
         self.debug_messages_dialog = DebugMessagesDialog()
-        self.debug_messages_logging_handler = LoggingHandler(self.debug_messages_dialog)
-        self.debug_messages_logging_handler.setLevel(logging.DEBUG)
-        self.debug_messages_logging_handler.logRecordReceived.signal.connect(self.debug_messages_dialog.add_message, Qt.QueuedConnection)
+        self.debug_messages_logging_handler = LoggingHandler(self.debug_messages_dialog)  # level follows the displayed log level
         root = logging.getLogger()
         root.addHandler(self.debug_messages_logging_handler)
 
@@ -361,8 +583,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         """Stop the sending process."""
         logger.debug('Stop the sending process.')
         self.sender_queue.put(CommandMessage(Command.STOP))
-        # Set the style sheet of the label to indicate that the server is running.
-        self.label_OutgoingTraffic_ServerStatus.setStyleSheet("background-color: red;\nborder: 1px solid gray;\nborder-radius: 10px;")
+        # Set the status indicator to indicate that the server is stopped.
+        self.label_OutgoingTraffic_ServerStatus.set_running(False)
 
 
     def toggle_active_input_port(self, item: QTableWidgetItem):
@@ -371,26 +593,30 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         row = item.row()
         column = item.column()
         if column == 0:
-            device_name = self.input_ports[row][1]
-            network_name = self.input_ports[row][2]
             item = self.tableWidget_LocalInputPorts.item(row, 0)
-            if item.checkState() == Qt.Checked:
-                self.input_ports[row] = (False, device_name, network_name)
-                item.setCheckState(Qt.Unchecked)
-            else:
-                self.input_ports[row] = (True, device_name, network_name)
-                item.setCheckState(Qt.Checked)
-            self.send_input_ports_to_worker_process()
+            # Changes of the check state are not handled by update_network_names();
+            # thus, the itemChanged signal is blocked.
+            with QSignalBlocker(self.tableWidget_LocalInputPorts):
+                if item.checkState() == Qt.Checked:
+                    self.input_ports_active[row] = False
+                    item.setCheckState(Qt.Unchecked)
+                else:
+                    self.input_ports_active[row] = True
+                    item.setCheckState(Qt.Checked)
+            self.schedule_sending_input_ports()
 
 
     def unselect_all_input_ports(self):
         """Unselect all input ports."""
         logger.debug('Unselect all input ports.')
-        for row in range(self.tableWidget_LocalInputPorts.rowCount()):
-            self.input_ports[row] = (False, self.input_ports[row][1], self.input_ports[row][2])
-            item = self.tableWidget_LocalInputPorts.item(row, 0)
-            item.setCheckState(Qt.Unchecked)
-        self.send_input_ports_to_worker_process()
+        self.input_ports_active[:] = [False] * len(self.input_ports_active)
+        # Block the itemChanged signal of the table widget; changes of the check
+        # states are not handled by update_network_names() anyway.
+        with QSignalBlocker(self.tableWidget_LocalInputPorts):
+            for row in range(self.tableWidget_LocalInputPorts.rowCount()):
+                item = self.tableWidget_LocalInputPorts.item(row, 0)
+                item.setCheckState(Qt.Unchecked)
+        self.schedule_sending_input_ports()
 
 
     def update_midi_clock_handling(self, state: int):
@@ -411,11 +637,11 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         row = item.row()
         column = item.column()
         if column == 1:
-            active = self.input_ports[row][0]
-            device_name = self.input_ports[row][1]
             network_name = item.text()
-            self.input_ports[row] = (active, device_name, network_name)
-            self.send_input_ports_to_worker_process()
+            if network_name == self.input_ports_network_names[row]:
+                return  # nothing changed (e.g., the cell was left without editing)
+            self.input_ports_network_names[row] = network_name
+            self.schedule_sending_input_ports()
 
 
     def update_round_trip_times(self, round_trip_times: dict[str, deque[float]]):
@@ -423,48 +649,58 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         logger.debug('Update round trip times.')
 
-        for ip_address, rtt in round_trip_times.items():
-            hostname = get_hostname(ip_address)
-
-            # Check if the hostname is already in the table widget.
-            found = False
-            for row in range(self.tableWidget_RTT.rowCount()):
-                item = self.tableWidget_RTT.item(row, 0)
-                if item is not None and item.text() == hostname:
-                    found = True
-                    break
-
-            if not found:
-                # Add a new row to the table widget.
-                self.tableWidget_RTT.setRowCount(self.tableWidget_RTT.rowCount() + 1)
-                row = self.tableWidget_RTT.rowCount() - 1
-                self.tableWidget_RTT.setItem(row, 0, QTableWidgetItem(hostname))
-                self.tableWidget_RTT.setItem(row, 1, QTableWidgetItem(""))
-                self.tableWidget_RTT.setItem(row, 2, QTableWidgetItem(""))
-                self.tableWidget_RTT.setItem(row, 3, QTableWidgetItem(""))
-                self.tableWidget_RTT.setItem(row, 4, QTableWidgetItem(""))
-                self.tableWidget_RTT.setItem(row, 5, QTableWidgetItem("Collecting data..."))
-
-            # Update the existing row.
-            minimum_value = min(rtt) * 1000
-            maximum_value = max(rtt) * 1000
-            median_value = median(rtt) * 1000
-            average_value = sum(rtt) / len(rtt) * 1000
-            item = self.tableWidget_RTT.item(row, 1)
-            item.setText(f"{minimum_value:.2f}")
-            item = self.tableWidget_RTT.item(row, 2)
-            item.setText(f"{maximum_value:.2f}")
-            item = self.tableWidget_RTT.item(row, 3)
-            item.setText(f"{median_value:.2f}")
-            item = self.tableWidget_RTT.item(row, 4)
-            item.setText(f"{average_value:.2f}")
-            item = self.tableWidget_RTT.item(row, 5)
-            item.setText("")
-
-            # Update the line chart.
-            if len(rtt) >= 3:
-                chart = LineChart()
-                chart.set_line_color(QColor(50, 50, 50))
-                chart.set_line_width(1)
-                chart.set_points(list(enumerate(rtt)))
-                self.tableWidget_RTT.setCellWidget(row, 5, chart)
+        # Update the table without repainting it for each cell and without
+        # emitting the itemChanged signal for each item.
+        table = self.tableWidget_RTT
+        get_item = table.item  # bound method, looked up once for all cells
+        table.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(table):
+                for ip_address, rtt in round_trip_times.items():
+                    # The hostname is looked up in the background, since a reverse
+                    # lookup may block for several seconds; until the lookup has
+                    # finished, the IP address is shown (see show_hostname()).
+                    hostname = get_cached_hostname(ip_address)
+                    if hostname is None and ip_address not in self.pending_hostname_lookups:
+                        self.pending_hostname_lookups.add(ip_address)
+                        run_in_background(lookup_hostname, ip_address, on_finished=self.show_hostname)
+
+                    row = self.round_trip_times_rows.get(ip_address)
+                    if row is None:
+                        # Add a new row to the table widget.
+                        row = table.rowCount()
+                        self.round_trip_times_rows[ip_address] = row
+                        table.setRowCount(row + 1)
+                        table.setItem(row, 0, QTableWidgetItem(hostname or ip_address))
+                        table.setItem(row, 1, QTableWidgetItem(""))
+                        table.setItem(row, 2, QTableWidgetItem(""))
+                        table.setItem(row, 3, QTableWidgetItem(""))
+                        table.setItem(row, 4, QTableWidgetItem(""))
+                        table.setItem(row, 5, QTableWidgetItem("Collecting data..."))
+
+                    # Update the existing row.
+                    # The statistics are taken from the sorted values (one sort in C
+                    # instead of separate passes for the minimum, maximum, and median).
+                    values = sorted(rtt)
+                    n = len(values)
+                    minimum_value = values[0] * 1000
+                    maximum_value = values[-1] * 1000
+                    median_value = (values[n // 2] if n % 2 else (values[n // 2 - 1] + values[n // 2]) / 2) * 1000
+                    average_value = sum(values) / n * 1000
+                    for column, value in enumerate((minimum_value, maximum_value, median_value, average_value), start=1):
+                        get_item(row, column).setText(f"{value:.2f}")
+
+                    # Update the line chart. The chart of a row is created once and
+                    # reused, i.e., only its points are replaced.
+                    if len(rtt) >= 3:
+                        chart = self.round_trip_times_charts.get(ip_address)
+                        if chart is None:
+                            chart = LineChart()
+                            chart.set_line_color(QColor(50, 50, 50))
+                            chart.set_line_width(1)
+                            self.round_trip_times_charts[ip_address] = chart
+                            get_item(row, 5).setText("")  # the line chart is shown instead of "Collecting data..."
+                            table.setCellWidget(row, 5, chart)
+                        chart.set_points(list(enumerate(rtt)))
+        finally:
+            table.setUpdatesEnabled(True)
@@ -8,21 +8,63 @@
 # pylint: disable=invalid-name
 # pylint: disable=no-name-in-module
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QEvent, Qt
 from PySide6.QtWidgets import QLabel
-from PySide6.QtGui import QPainter
+from PySide6.QtGui import QPainter, QPixmap
 
 
 class RotatedLabel(QLabel):
-    """A label that is rotated by 90 degrees anticlockwise."""
+    """A label that is rotated by 90 degrees anticlockwise.
+
+    The rotated text is rendered into a pixmap, which is reused for all
+    repaints until the text, size, font, palette, or style changes.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the label; the arguments are passed to QLabel."""
+        super().__init__(*args, **kwargs)
+        self.cached_pixmap: QPixmap | None = None  # rendered label; None if it must be rendered again
+
+
+    def changeEvent(self, event):
+        """Override the change event to render the label again if its appearance changes."""
+        if event.type() in (QEvent.Type.FontChange, QEvent.Type.PaletteChange, QEvent.Type.StyleChange,
+                            QEvent.Type.EnabledChange, QEvent.Type.ActivationChange):  # the text color depends on the enabled and active state
+            self.cached_pixmap = None
+            self.update()
+        super().changeEvent(event)
+
 
     def paintEvent(self, event):
-        """Override the paint event to rotate the text."""
+        """Override the paint event to draw the rotated text."""
+        ratio = self.devicePixelRatioF()
+        if self.cached_pixmap is None or self.cached_pixmap.devicePixelRatio() != ratio:  # e.g., moved to another screen
+            pixmap = QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setFont(self.font())
+            painter.setPen(self.palette().color(self.foregroundRole()))
+            painter.translate(self.width() / 2, self.height() / 2)
+            painter.rotate(-90)
+            painter.translate(-self.height() / 2, -self.width() / 2)
+            painter.drawText(0, 0, self.height(), self.width(), Qt.AlignHCenter, self.text())
+            painter.end()
+            self.cached_pixmap = pixmap
         painter = QPainter(self)
-        painter.translate(self.width() / 2, self.height() / 2)
-        painter.rotate(-90)
-        painter.translate(-self.height() / 2, -self.width() / 2)
-        painter.drawText(0, 0, self.height(), self.width(), Qt.AlignHCenter, self.text())
+        painter.drawPixmap(0, 0, self.cached_pixmap)
+
+
+    def resizeEvent(self, event):
+        """Override the resize event to render the label again with the new size."""
+        self.cached_pixmap = None
+        super().resizeEvent(event)
+
+
+    def setText(self, text: str):
+        """Override setText to render the label again with the new text."""
+        self.cached_pixmap = None
+        super().setText(text)
 
 
     def sizeHint(self):
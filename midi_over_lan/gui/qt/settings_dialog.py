@@ -22,6 +22,7 @@
 import logging
 import multiprocessing
 import socket
+import time
 
 from functools import cache
 from PySide6.QtWidgets import QDialog, QWidget, QMessageBox
@@ -55,6 +56,30 @@ def get_local_ip_address():
     return ip_address
 
 
+HOSTNAME_CACHE_TIMEOUT = 30.0  # seconds
+_hostname_cache: dict[str, tuple[float, str | None]] = {}  # key is the hostname; value is (timestamp, IP address or None if it cannot be resolved)
+
+
+def resolve_hostname(hostname: str) -> str:
+    """Return the IPv4 address of the hostname (or IPv4 address in dot-decimal notation).
+
+    The results (including failures) are cached for HOSTNAME_CACHE_TIMEOUT
+    seconds, since a lookup may block for a long time if the name service is
+    slow or misconfigured. Raises socket.gaierror if the name cannot be resolved.
+    """
+    now = time.monotonic()
+    cached = _hostname_cache.get(hostname)
+    if cached is None or now - cached[0] >= HOSTNAME_CACHE_TIMEOUT:
+        try:
+            ip_address = socket.gethostbyname(hostname)
+        except socket.gaierror:
+            ip_address = None
+        cached = _hostname_cache[hostname] = (now, ip_address)
+    if cached[1] is None:
+        raise socket.gaierror(f"Cannot resolve '{hostname}'.")
+    return cached[1]
+
+
 ##################################################################################################
 # SettingsDialog
 ##################################################################################################
@@ -74,6 +99,7 @@ class SettingsDialog(QDialog, Ui_Settings):
         self.sender_queue = sender_queue
         self.receiver_queue = receiver_queue
         self.result_queue = result_queue
+        self.network_interface: str | None = None  # IP address last sent to the worker processes
         self.lineEdit_NetworkInterface.editingFinished.connect(self.update_network_interface)
         self.checkBox_EnableLoopback.stateChanged.connect(self.update_loopback)
         self.checkBox_SaveCpuTime.stateChanged.connect(self.update_save_cpu_time)
@@ -99,16 +125,21 @@ class SettingsDialog(QDialog, Ui_Settings):
         text = self.lineEdit_NetworkInterface.text()
         # Check if the text is a valid hostname or a valid IPv4 address in dot-decimal notation.
         try:
-            ip_address = socket.gethostbyname(text)
+            ip_address = resolve_hostname(text)
         except socket.gaierror:
             # If the hostname cannot be resolved, try to get the IP address of the local host.
             try:
-                ip_address = socket.gethostbyname(socket.gethostname())
+                ip_address = resolve_hostname(socket.gethostname())
             except socket.gaierror:
                 ip_address = get_local_ip_address()  # falls back to localhost ('127.0.0.1') in case of failure
             logger.warning(f"Invalid network interface: {text} Use {ip_address} instead.")
-            QMessageBox.warning(self, "Invalid network interface", "Invalid network interface: {text}")
+            QMessageBox.warning(self, "Invalid network interface", f"Invalid network interface: {text}")
             self.lineEdit_NetworkInterface.setText(ip_address)
+        # The signal editingFinished is also emitted if the line edit merely
+        # loses the focus; the worker processes are only updated on changes.
+        if ip_address == self.network_interface:
+            return
+        self.network_interface = ip_address
         # Set the ip address used in the worker processes.
         self.sender_queue.put(CommandMessage(Command.SET_NETWORK_INTERFACE, ip_address))
         self.receiver_queue.put(CommandMessage(Command.SET_NETWORK_INTERFACE, ip_address))
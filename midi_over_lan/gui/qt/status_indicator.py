@@ -0,0 +1,51 @@
+# Copyright (c) 2025 Christoph Hänisch.
+# This file is part of the MIDI over LAN project.
+# It is licensed under the GNU Lesser General Public License v3.0.
+# See the LICENSE file for more details.
+
+"""This module implements a label widget that indicates a running or stopped state."""
+
+# pylint: disable=invalid-name
+# pylint: disable=no-name-in-module
+
+from PySide6.QtCore import QRectF, Qt
+from PySide6.QtWidgets import QLabel
+from PySide6.QtGui import QBrush, QColor, QPainter, QPen
+
+
+# The brushes and the pen are created once and shared by all indicators.
+RUNNING_BRUSH = QBrush(QColor("green"))
+STOPPED_BRUSH = QBrush(QColor("red"))
+BORDER_PEN = QPen(QColor("gray"), 1)
+
+
+class StatusIndicator(QLabel):
+    """A label that is drawn as a green (running) or red (stopped) rounded rectangle with a gray border.
+
+    The indicator is painted directly instead of using a style sheet; thus,
+    switching the state only requires a repaint of the widget.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the indicator; the arguments are passed to QLabel."""
+        super().__init__(*args, **kwargs)
+        self.running = True
+
+
+    def paintEvent(self, event):
+        """Override the paint event to draw the indicator."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(BORDER_PEN)
+        painter.setBrush(RUNNING_BRUSH if self.running else STOPPED_BRUSH)
+        rect = QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5)  # keep the border within the widget
+        radius = min(10.0, rect.width() / 2, rect.height() / 2)
+        painter.drawRoundedRect(rect, radius, radius, Qt.SizeMode.AbsoluteSize)
+
+
+    def set_running(self, running: bool):
+        """Set the state of the indicator and repaint it if the state changes."""
+        if running == self.running:
+            return
+        self.running = running
+        self.update()
@@ -16,8 +16,9 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QImage, QKeySequence, QLinearGradient, QPainter,
     QPalette, QPixmap, QRadialGradient, QTransform)
 from PySide6.QtWidgets import (QApplication, QCheckBox, QDialog, QGroupBox,
-    QHBoxLayout, QPushButton, QRadioButton, QSizePolicy,
-    QSpacerItem, QTextEdit, QVBoxLayout, QWidget)
+    QHBoxLayout, QLabel, QPushButton, QRadioButton,
+    QSizePolicy, QSpacerItem, QSpinBox, QTextEdit,
+    QVBoxLayout, QWidget)
 
 class Ui_DebugMessages(object):
     def setupUi(self, DebugMessages):
@@ -75,6 +76,27 @@ class Ui_DebugMessages(object):
 
         self.horizontalLayout_3.addWidget(self.groupBox_ScrollToBottom)
 
+        self.groupBox_MaximumNumberOfLines = QGroupBox(DebugMessages)
+        self.groupBox_MaximumNumberOfLines.setObjectName(u"groupBox_MaximumNumberOfLines")
+        self.horizontalLayout_4 = QHBoxLayout(self.groupBox_MaximumNumberOfLines)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.label_MaximumNumberOfLines = QLabel(self.groupBox_MaximumNumberOfLines)
+        self.label_MaximumNumberOfLines.setObjectName(u"label_MaximumNumberOfLines")
+
+        self.horizontalLayout_4.addWidget(self.label_MaximumNumberOfLines)
+
+        self.spinBox_MaximumNumberOfLines = QSpinBox(self.groupBox_MaximumNumberOfLines)
+        self.spinBox_MaximumNumberOfLines.setObjectName(u"spinBox_MaximumNumberOfLines")
+        self.spinBox_MaximumNumberOfLines.setMinimum(100)
+        self.spinBox_MaximumNumberOfLines.setMaximum(1000000)
+        self.spinBox_MaximumNumberOfLines.setSingleStep(100)
+        self.spinBox_MaximumNumberOfLines.setValue(2000)
+
+        self.horizontalLayout_4.addWidget(self.spinBox_MaximumNumberOfLines)
+
+
+        self.horizontalLayout_3.addWidget(self.groupBox_MaximumNumberOfLines)
+
         self.horizontalSpacer = QSpacerItem(276, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
 
         self.horizontalLayout_3.addItem(self.horizontalSpacer)
@@ -115,6 +137,8 @@ class Ui_DebugMessages(object):
         self.radioButton_Critical.setText(QCoreApplication.translate("DebugMessages", u"Critical", None))
         self.groupBox_ScrollToBottom.setTitle("")
         self.checkBox_ScrollToBottom.setText(QCoreApplication.translate("DebugMessages", u"Scroll to Bottom", None))
+        self.groupBox_MaximumNumberOfLines.setTitle("")
+        self.label_MaximumNumberOfLines.setText(QCoreApplication.translate("DebugMessages", u"Maximum Number of Lines", None))
         self.pushButton_ClearAllMessages.setText(QCoreApplication.translate("DebugMessages", u"  Clear All Messages  ", None))
     # retranslateUi
 
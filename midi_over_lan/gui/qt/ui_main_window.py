@@ -25,6 +25,7 @@ from PySide6.QtWidgets import (QAbstractItemView, QApplication, QCheckBox, QFram
 
 from rotated_label import RotatedLabel
 from routing_matrix import RoutingMatrix
+from status_indicator import StatusIndicator
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -188,7 +189,7 @@ class Ui_MainWindow(object):
 
         self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
 
-        self.label_OutgoingTraffic_ServerStatus = QLabel(self.groupBox_Server_OutgoingTraffic)
+        self.label_OutgoingTraffic_ServerStatus = StatusIndicator(self.groupBox_Server_OutgoingTraffic)
         self.label_OutgoingTraffic_ServerStatus.setObjectName(u"label_OutgoingTraffic_ServerStatus")
         sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         sizePolicy2.setHorizontalStretch(0)
@@ -197,9 +198,6 @@ class Ui_MainWindow(object):
         self.label_OutgoingTraffic_ServerStatus.setSizePolicy(sizePolicy2)
         self.label_OutgoingTraffic_ServerStatus.setMinimumSize(QSize(20, 20))
         self.label_OutgoingTraffic_ServerStatus.setMaximumSize(QSize(20, 20))
-        self.label_OutgoingTraffic_ServerStatus.setStyleSheet(u"background-color: green;\n"
-"border: 1px solid gray;\n"
-"border-radius: 10px;")
 
         self.horizontalLayout_2.addWidget(self.label_OutgoingTraffic_ServerStatus)
 
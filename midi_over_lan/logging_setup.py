@@ -35,6 +35,33 @@ The module provides the following functions:
 import logging
 import logging.handlers
 import multiprocessing
+from queue import Empty, Full
+
+MAXIMUM_BATCH_SIZE = 100  # maximum number of log records taken from the queue at once
+
+
+class DropOldestQueueHandler(logging.handlers.QueueHandler):
+    """A queue handler that never blocks and drops the oldest record if the queue is full.
+
+    Thus, worker processes are not slowed down if the main process cannot keep
+    up with processing the log messages; in that case, log messages are lost.
+    If the oldest record cannot be taken from the queue immediately (e.g., it
+    has not been written to the underlying pipe yet), the new record is dropped.
+    """
+
+    def enqueue(self, record: logging.LogRecord):
+        """Put the record into the queue, making room for it if necessary."""
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            try:
+                self.queue.get_nowait()  # drop the oldest record
+            except Empty:
+                pass
+            try:
+                self.queue.put_nowait(record)
+            except Full:
+                pass  # drop the record (the queue was filled up again in the meantime)
 
 
 def init_logger(log_queue: multiprocessing.Queue,
@@ -75,7 +102,7 @@ def init_logger(log_queue: multiprocessing.Queue,
     Returns:
         logging.Logger: The logger object that uses the given log queue.
     """
-    handler = logging.handlers.QueueHandler(log_queue)
+    handler = DropOldestQueueHandler(log_queue)
     logger = logging.getLogger(name)
     logger.propagate = False
     logger.setLevel(level)
@@ -91,11 +118,15 @@ def logger_thread(queue: multiprocessing.Queue):
      
     The function starts a logging queue listener that processes log messages
     sent by the worker processes in the background. If the queue is full, the
-    worker processes will block until the main process has processed some log
-    messages. This is, why the function should be called as early as possible.
+    worker processes drop their oldest log messages (see DropOldestQueueHandler).
+    This is, why the function should be called as early as possible.
 
     The thread is stopped by putting a 'None' object into the queue.
 
+    Log records that are already waiting in the queue are taken in batches of
+    up to MAXIMUM_BATCH_SIZE records, so the thread only blocks if the queue
+    is empty.
+
     How to use:
 
         ```python
@@ -113,8 +144,14 @@ def logger_thread(queue: multiprocessing.Queue):
         ```
     """
     while True:
-        record = queue.get()
-        if record is None:
-            break
-        logger = logging.getLogger(record.name)
-        logger.handle(record)
+        records = [queue.get()]
+        while len(records) < MAXIMUM_BATCH_SIZE:
+            try:
+                records.append(queue.get_nowait())
+            except Empty:
+                break
+        for record in records:
+            if record is None:
+                return
+            logger = logging.getLogger(record.name)
+            logger.handle(record)
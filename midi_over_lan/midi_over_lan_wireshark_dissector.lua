@@ -1,5 +1,5 @@
 -- Written by: Christoph Hänisch (with the help of ChatGPT)
--- Last Change: 2025-05-12
+-- Last Change: 2026-10-16
 -- License: LGPL v3.0 or later (see LICENSE file)
 
 -- Define the MIDI over LAN protocol
@@ -16,6 +16,7 @@ local f_packet_type = ProtoField.uint8("midilan.packet_type", "Packet Type", bas
 local f_device_name_length = ProtoField.uint8("midilan.device_name_length", "Device Name Length", base.DEC)
 local f_device_name = ProtoField.string("midilan.device_name", "Device Name")
 local f_midi_data = ProtoField.bytes("midilan.midi_data", "MIDI Data")
+local f_midi_message = ProtoField.bytes("midilan.midi_message", "MIDI Message")
 local f_num_device_names = ProtoField.uint8("midilan.num_device_names", "Number of Device Names", base.DEC)
 local f_id = ProtoField.uint32("midilan.id", "ID", base.DEC)
 local f_hostname_length = ProtoField.uint8("midilan.hostname_length", "Hostname Length", base.DEC)
@@ -24,9 +25,47 @@ local f_ip_address = ProtoField.ipv4("midilan.ip_address", "IP Address")
 
 midi_lan_proto.fields = {
     f_header_mark, f_version, f_packet_type, f_device_name_length, f_device_name,
-    f_midi_data, f_num_device_names, f_id, f_hostname_length, f_hostname, f_ip_address
+    f_midi_data, f_midi_message, f_num_device_names, f_id, f_hostname_length, f_hostname, f_ip_address
 }
 
+-- Return the length of the MIDI message starting with the given status byte
+-- (system exclusive messages are handled separately).
+local function midi_message_length(status)
+    if status >= 0x80 and status <= 0xBF then return 3      -- note off/on, poly pressure, control change
+    elseif status >= 0xC0 and status <= 0xDF then return 2  -- program change, channel pressure
+    elseif status >= 0xE0 and status <= 0xEF then return 3  -- pitch bend
+    elseif status == 0xF1 or status == 0xF3 then return 2  -- MTC quarter frame, song select
+    elseif status == 0xF2 then return 3                     -- song position pointer
+    else return 1                                           -- tune request, real-time messages, invalid bytes
+    end
+end
+
+-- Add the MIDI messages of the MIDI data to the tree. A packet may contain
+-- several consecutive, complete MIDI messages (without running status). The
+-- buffer is the TvbRange of the MIDI data.
+local function add_midi_messages(tree, buffer)
+    local offset = 0
+    local length = buffer:len()
+    while offset < length do
+        local status = buffer:range(offset, 1):uint()
+        local message_length
+        if status == 0xF0 then
+            -- System exclusive: up to and including the end of exclusive byte (0xF7).
+            message_length = length - offset
+            for i = offset + 1, length - 1 do
+                if buffer:range(i, 1):uint() == 0xF7 then
+                    message_length = i - offset + 1
+                    break
+                end
+            end
+        else
+            message_length = math.min(midi_message_length(status), length - offset)
+        end
+        tree:add(f_midi_message, buffer:range(offset, message_length))
+        offset = offset + message_length
+    end
+end
+
 -- Create the dissector function
 function midi_lan_proto.dissector(buffer, pinfo, tree)
     pinfo.cols.protocol = midi_lan_proto.name
@@ -45,7 +84,9 @@ function midi_lan_proto.dissector(buffer, pinfo, tree)
         local device_name_length = buffer(6,1):uint()
         subtree:add(f_device_name_length, buffer(6,1))
         subtree:add(f_device_name, buffer(7, device_name_length))
-        subtree:add(f_midi_data, buffer(7 + device_name_length))
+        local midi_data = buffer(7 + device_name_length)
+        local midi_data_tree = subtree:add(f_midi_data, midi_data)
+        add_midi_messages(midi_data_tree, midi_data)
     elseif packet_type == 1 then
         -- Hello Packet
         subtree:add(f_id, buffer(6,4))
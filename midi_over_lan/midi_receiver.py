@@ -267,13 +267,14 @@ class MidiReceiver(multiprocessing.Process):
         """Process incoming MIDI message packets."""
         while self.received_midi_messages:
             packet, addr = self.received_midi_messages.popleft()
-            midi_message = mido.parse(packet.midi_data)
-            logger.debug(f"Received MIDI message(s) from {addr}, {packet.device_name}: {midi_message}")
+            midi_messages = mido.parse_all(packet.midi_data)  # a packet may contain several MIDI messages
+            logger.debug(f"Received MIDI message(s) from {addr}, {packet.device_name}: {midi_messages}")
             if output_port_names := self.routing_connections.get(packet.device_name):  # get output port names associated with the current MIDI network device
                 for output_port_name in output_port_names:
                     if output_port := self.midi_output_ports.get(output_port_name):
                         try:
-                            output_port.send(midi_message)
+                            for midi_message in midi_messages:
+                                output_port.send(midi_message)
                         except Exception as error:
                             logger.error(f"Failed to send MIDI message to output port '{output_port_name}': {error}")
 
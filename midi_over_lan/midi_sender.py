@@ -18,7 +18,7 @@ from socket import (inet_aton,
                     IPPROTO_UDP,
                     SOCK_DGRAM,
                     socket)
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 import mido
 from mido.ports import BasePort
@@ -63,6 +63,7 @@ class MidiSender(multiprocessing.Process):
         self.ui_queue = ui_queue
         self.log_queue = log_queue
         self.sock = None  # created in the run() method
+        self.send_packet = None  # function sending a packet to the multicast group; set in setup_socket()
         self.network_interface = "127.0.0.1"
         self.enable_multicast_loop = True
         self.restart = True
@@ -70,6 +71,7 @@ class MidiSender(multiprocessing.Process):
         self.paused = False
         self.midi_input_ports: List[Tuple[str, str]]  = []  # List of tuples (input port name, MIDI device's network name)
         self.opened_input_ports: List[Tuple[BasePort, str]] = []   # List of tuples (mido port, MIDI device's network name)
+        self.packet_prefixes: Dict[str, bytes] = {}  # key is the MIDI device's network name; value is the serialized packet without the MIDI data
         self.ignore_midi_clock = True
         self.save_cpu_time = True
         self.timestamp_of_last_hello = None  # time when the last hello packet was sent
@@ -92,10 +94,14 @@ class MidiSender(multiprocessing.Process):
         global logger  # pylint: disable=global-statement
         logger = init_logger(self.log_queue, name="midi_over_lan.sender", level=logging.DEBUG)
 
+        acknowledge_restart = False  # Only an explicit RESTART command is acknowledged
         while self.restart:
             self.restart = False  # Flag can be set via the RESTART command
             with socket(AF_INET, SOCK_DGRAM, IPPROTO_UDP) as self.sock:
                 self.setup_socket()
+                if acknowledge_restart:
+                    self.ui_queue.put(InfoMessage(Information.SENDER_READY))
+                    acknowledge_restart = False
                 self.running = True  # Flag is set via the STOP and RESTART command
                 while self.running:
                     try:
@@ -106,6 +112,7 @@ class MidiSender(multiprocessing.Process):
                                     logger.debug("Restarting.")
                                     self.running = False
                                     self.restart = True
+                                    acknowledge_restart = True
                                     break
                                 case Command.PAUSE:
                                     logger.debug("Pausing.")
@@ -174,7 +181,7 @@ class MidiSender(multiprocessing.Process):
             message = InfoMessage(Information.HELLO_PACKET_INFO, (packet.id, time.perf_counter()))
             self.receiver_queue.put(message)  # Inform the receiver about the sent hello packet
             try:
-                self.sock.sendto(packet.to_bytes(), (MULTICAST_GROUP_ADDRESS, MULTICAST_PORT_NUMBER))
+                self.send_packet(packet.to_bytes())
             except OSError as error:
                 logger.error(f"Could not send 'Hello' packet: {error}")
 
@@ -186,7 +193,7 @@ class MidiSender(multiprocessing.Process):
         logger.debug(f"Internal transmission time: {(time.perf_counter() - time_of_arrival) * 1000:.2f} milliseconds.")
         packet = HelloReplyPacket(id=hello_packet_id, remote_ip=remote_ip)
         try:
-            self.sock.sendto(packet.to_bytes(), (MULTICAST_GROUP_ADDRESS, MULTICAST_PORT_NUMBER))
+            self.send_packet(packet.to_bytes())
         except OSError as error:
             logger.error(f"Could not send 'Hello Reply' packet: {error}")
         except Exception:  # pylint: disable=broad-except
@@ -196,14 +203,13 @@ class MidiSender(multiprocessing.Process):
     def send_midi_messages(self):
         """Poll the MIDI input ports and send the message(s) to the multicast address."""
         for port, device_name in self.opened_input_ports:
+            prefix = self.packet_prefixes[device_name]  # header and device name do not change between messages
             for message in port.iter_pending():
                 if self.ignore_midi_clock and message.type == 'clock':
                     continue
-                logger.debug(f"Sending MIDI message ({message}).")
-                packet = MidiMessagePacket(device_name=device_name, midi_data=bytes(message.bytes()))
-                logger.debug(str(packet).replace("\n", " "))  # Print the packet in a single line
+                logger.debug(f"Sending MIDI message ({message}) of device '{device_name}'.")
                 try:
-                    self.sock.sendto(packet.to_bytes(), (MULTICAST_GROUP_ADDRESS, MULTICAST_PORT_NUMBER))
+                    self.send_packet(prefix + message.bin())
                 except OSError as error:
                     logger.error(f"Could not send MIDI message: {error}")
 
@@ -255,10 +261,12 @@ class MidiSender(multiprocessing.Process):
 
         # Open the new MIDI input ports
         self.opened_input_ports = []
+        self.packet_prefixes = {}
         for input_port_name, device_name in self.midi_input_ports:
             try:
                 port = mido.open_input(input_port_name)
                 self.opened_input_ports.append((port, device_name))
+                self.packet_prefixes[device_name] = MidiMessagePacket(device_name=device_name).prefix_to_bytes()
             except OSError as error:
                 logger.error(f"Could not open MIDI input port '{input_port_name}': {error}")
 
@@ -321,4 +329,17 @@ class MidiSender(multiprocessing.Process):
         except OSError as error:
             logger.error(f"Could not set network interface '{self.network_interface}': {error}")
             self.network_interface = "127.0.0.0"
-            return
+
+        # Connect the socket to the multicast group, so that the destination
+        # address is resolved once and need not be passed with each packet.
+        # Note, this must be done after setting the network interface, since
+        # the source address is determined when connecting. If the socket
+        # cannot be connected, the destination address is passed with each
+        # packet instead.
+        try:
+            self.sock.connect((MULTICAST_GROUP_ADDRESS, MULTICAST_PORT_NUMBER))
+            self.send_packet = self.sock.send
+        except OSError as error:
+            logger.error(f"Could not connect to the multicast group '{MULTICAST_GROUP_ADDRESS}': {error}")
+            sock = self.sock
+            self.send_packet = lambda data: sock.sendto(data, (MULTICAST_GROUP_ADDRESS, MULTICAST_PORT_NUMBER))
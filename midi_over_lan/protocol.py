@@ -48,7 +48,17 @@ Technical details:
     The 'MIDI Message' packet's payload includes the device name and MIDI
     message data. The device name is a UTF-8 encoded Pascal-like string with a
     maximum length of 64 bytes, preceded by a 1-byte length field. The MIDI
-    message data follows, with variable length.
+    message data follows, with variable length. It may contain several
+    consecutive, complete MIDI messages of the same device (each with its own
+    status byte, i.e., without running status); the packet should not exceed
+    MAXIMUM_MIDI_MESSAGE_PACKET_SIZE bytes, so that it is not fragmented.
+
+    Note: Earlier implementations put exactly one MIDI message into each packet
+    and decoded only the first message of the MIDI data (e.g., with
+    mido.parse()). Such receivers silently drop all further messages of a
+    packet. Receivers must decode all messages (e.g., with mido.parse_all())
+    and should provide a receive buffer of at least
+    MAXIMUM_MIDI_MESSAGE_PACKET_SIZE bytes.
 
     +-----------------------------+-----------------------------+-----------------------------+
     | Device Name Length (1 byte) | Device Name (max. 64 bytes) | MIDI Data (variable length) |
@@ -90,7 +100,7 @@ Technical details:
         3. Packet Type (1 byte): Defined in the 'PacketType' enumeration.
         4. Device Name Length (1 byte): Length of the device name.
         5. Device Name (variable length): UTF-8 encoded name of the MIDI device.
-        5. MIDI Data (variable length): Actual MIDI message data.
+        6. MIDI Data (variable length): One or more complete MIDI messages.
     
     The 'Hello' packet structure is as follows:
 
@@ -363,6 +373,7 @@ class Parser():
 VERSION_NUMBER = 1  # version number of the MIDI over LAN protocol
 MULTICAST_GROUP_ADDRESS = '239.0.3.250'  # MIDI over LAN multicast address
 MULTICAST_PORT_NUMBER = 56129  # MIDI over LAN port number
+MAXIMUM_MIDI_MESSAGE_PACKET_SIZE = 1400  # bytes; stays below the path MTU (incl. IP and UDP headers) to avoid fragmentation
 
 # The below indices are used to access the fields of the MIDI over LAN packets
 # and are derived from the packet structure described in the module docstring.
@@ -434,13 +445,15 @@ class Packet():
         # Handle MIDI over LAN packets
         if data[_VERSION_FIELD_INDEX] != VERSION_NUMBER:
             raise ValueError("Invalid MIDI over LAN packet version")
+        # MIDI messages are by far the most frequent packets; check them first.
+        # The data has already been validated, so the unvalidated parser is used.
         match data[_PACKET_TYPE_INDEX]:
+            case PacketType.MIDI_MESSAGE:
+                return MidiMessagePacket.parse(data)
             case PacketType.HELLO:
                 return HelloPacket.from_bytes(data)
             case PacketType.HELLO_REPLY:
                 return HelloReplyPacket.from_bytes(data)
-            case PacketType.MIDI_MESSAGE:
-                return MidiMessagePacket.from_bytes(data)
             case _:
                 logger.error(f"Invalid data: {data}")
                 raise ValueError("Unknown MIDI over LAN packet type")
@@ -475,6 +488,16 @@ class MidiMessagePacket(Packet):
         assumed that the data is solely the payload of the packet (MIDI data)
         and a MIDI message packet object is created from this data.
         """
+        return MidiMessagePacket.parse(data)
+
+
+    @staticmethod
+    def parse(data: bytes):
+        """Create a MIDI message packet object from a byte string.
+
+        Same as from_bytes() but without validating the argument. This is the
+        receiving hot path; callers must pass a bytes object.
+        """
         logger.debug(data)
 
         if not data.startswith(Packet.MIDI_MESSAGE_PACKET_HEADER):
@@ -484,18 +507,25 @@ class MidiMessagePacket(Packet):
         minimum_packet_length = _HEADER_LENGTH + 1 + device_name_length + 1  # header + device name length + device name + 1 byte of MIDI data
         if len(data) < minimum_packet_length:
             raise ValueError("MIDI over LAN packet is too short")
-        packet = MidiMessagePacket()
         start = _MIDI_MESSAGE_PACKET__DEVICE_NAME_INDEX
         end = start + device_name_length
-        packet.device_name = data[start:end].decode('utf-8').strip('\x00')
-        packet.midi_data = data[end:]
-        return packet
+        return MidiMessagePacket(device_name=data[start:end].decode('utf-8').strip('\x00'), midi_data=data[end:])
+
+
+    def prefix_to_bytes(self):
+        """Return the MIDI message packet without the MIDI data as a byte string.
+
+        The prefix consists of the header and the device name field. Since it
+        only depends on the device name, it may be computed once per device and
+        be prepended to the MIDI data of each message (see to_bytes()).
+        """
+        device_name = to_byte_string(self.device_name, 64)
+        return self.header + len(device_name).to_bytes(length=1, byteorder='big') + device_name
 
 
     def to_bytes(self):
         """Return the MIDI message packet as a byte string (e.g., for using it in a UDP packet)."""
-        device_name = to_byte_string(self.device_name, 64)
-        return self.header + len(device_name).to_bytes(length=1, byteorder='big') + device_name + self.midi_data
+        return self.prefix_to_bytes() + self.midi_data
 
 
 @dataclass
@@ -218,19 +218,20 @@ def send_midi_messages(input_port_names: str,
         print()
         try:
             input_ports = [mido.open_input(port_name) for port_name in input_port_names]
+            # The packet header and the device name are the same for all messages of a port.
+            device_names = [input_port.name.split(':')[0] for input_port in input_ports]
+            prefixes = [MidiMessagePacket(device_name=name).prefix_to_bytes() for name in device_names]
             while True:
                 # For each MIDI input port...
-                for input_port in input_ports:
-                    input_port_name = input_port.name.split(':')[0]
+                for input_port, device_name, prefix in zip(input_ports, device_names, prefixes):
                     # ... poll the port and send the message(s) to the multicast address
                     for message in input_port.iter_pending():
                         if ignore_clock and message.type == 'clock':
                             continue
                         if verbosity_level > 0:
-                            print(f"{input_port_name}: {message}")
-                        packet = MidiMessagePacket(device_name=input_port_name, midi_data=bytes(message.bytes()))
+                            print(f"{device_name}: {message}")
                         with DelayedKeyboardInterrupt():
-                            sock.sendto(packet.to_bytes(), (MULTICAST_GROUP_ADDRESS, MULTICAST_PORT_NUMBER))
+                            sock.sendto(prefix + message.bin(), (MULTICAST_GROUP_ADDRESS, MULTICAST_PORT_NUMBER))
                     # time.sleep(0.001)
         except OSError as os_error:
             print(f"OSError: {os_error}")
@@ -171,6 +171,17 @@ class Information(Enum):
                    to:  The UI client.
 
 
+        SENDER_READY:
+            objective:  Inform the UI client that the sending worker process has
+                        restarted its processing loop after a RESTART command,
+                        i.e., the socket is set up and commands are processed
+                        again. Only explicit RESTART commands are acknowledged.
+                        The UI client uses this to update the server status.
+                 data:  None
+                 from:  The sending worker process.
+                   to:  The UI client.
+
+
         ROUTING_INFORMATION:
             objective:  Provide information about which remote MIDI device shall
                         be mapped to which local MIDI output port. The receiving
@@ -188,11 +199,15 @@ class Information(Enum):
     REMOTE_MIDI_DEVICES = auto()
     ROUND_TRIP_TIMES = auto()
     ROUTING_INFORMATION = auto()
+    SENDER_READY = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandMessage:
     """Command message.
+
+    The class uses slots to keep the instances small, since command messages
+    are pickled each time they are put into a multiprocessing queue.
     
     Attributes:
         command: The command to be executed.
@@ -210,9 +225,12 @@ class CommandMessage:
     data: Any = None
 
 
-@dataclass
+@dataclass(slots=True)
 class InfoMessage:
     """Info message.
+
+    Like the command message, the class uses slots to keep the instances (and
+    the pickled payload) small.
     
     Attributes:
         info: The information to be conveyed.